@@ -0,0 +1,62 @@
+"""Benchmark: parse time of signal API responses
+
+Compares parse_signal_response() against the previous split/strptime
+line parser on synthetic responses.
+
+Usage: python benchmarks/bench_parser.py [--lines 10000] [--repeat 20]
+"""
+import argparse
+import re
+import time
+from datetime import datetime, timedelta
+
+from common import load_app, make_signal_response
+
+def legacy_parse(text, mode, min_percentage, offset_minutes):
+    """The line-by-line parser used before parse_signal_records()"""
+    if "Signals:" not in text:
+        return None, []
+    signals = []
+    date_match = re.search(r"Date: (\d{2}/\d{2}/\d{4})", text)
+    api_date = date_match.group(1) if date_match else "Unknown Date"
+    for line in text.split("\n"):
+        if "PA～" in line:
+            parts = line.strip().split("～")
+            if len(parts) >= 4:
+                bd_time = datetime.strptime(parts[2], "%H:%M").replace(year=2025, month=1, day=16)
+                time_ist = (bd_time + timedelta(minutes=offset_minutes)).strftime("%H:%M")
+                action = "N/A" if "blackout" in mode.lower() else (parts[3].upper() if parts[3] else "N/A")
+                signals.append({"pair": parts[1], "time": time_ist, "action": action, "percentage": min_percentage})
+    return api_date, signals
+
+def best_of(func, repeat):
+    """Best wall time in seconds over `repeat` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=10000, help="signal lines per response")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    app = load_app()
+    pairs = [pair for pair, _ in app.currency_pairs]
+    text = make_signal_response(pairs, args.lines)
+    offset = app.TIMEZONE_OPTIONS["1"]["offset"]
+
+    legacy = best_of(lambda: legacy_parse(text, "normal", "100", offset), args.repeat)
+    records = best_of(lambda: app.parse_signal_records(text), args.repeat)
+    signals = best_of(lambda: app.parse_signal_response(text, "normal", "100", "1"), args.repeat)
+
+    print(f"Response: {args.lines} lines, {len(text.encode('utf-8')) / 1024:.0f} KiB")
+    print(f"{'legacy line parser':<28} {legacy * 1000:8.2f} ms")
+    print(f"{'parse_signal_records':<28} {records * 1000:8.2f} ms  ({legacy / records:.1f}x)")
+    print(f"{'parse_signal_response':<28} {signals * 1000:8.2f} ms  ({legacy / signals:.1f}x)")
+
+if __name__ == "__main__":
+    main()
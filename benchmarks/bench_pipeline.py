@@ -0,0 +1,194 @@
+"""Benchmark: fetch → parse → schedule → send against local API stand-ins
+
+Starts benchmarks/stub_server.py in a separate process (so its CPU is not
+counted) and points the app's signal API and Telegram URLs at it.
+
+1. Fetch/parse: repeated cold fetches of one bot's query through
+   fetch_query(), plus a convert_to_indian_time() micro loop.
+2. Schedule/send: `--bots` bot profiles run through run_profiles_async().
+   Every pair has a signal whose send moment is `--lead` seconds away. The
+   time each Telegram call reaches the stub is compared with that moment.
+
+Reports throughput, p50/p99 send-time error relative to send_before and
+CPU per bot.
+
+Usage: python benchmarks/bench_pipeline.py [--bots 4] [--pairs 5] [--days 3]
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.parse
+import urllib.request
+from datetime import datetime, timedelta
+
+from common import load_app
+
+STUB_SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_server.py")
+
+def start_stub():
+    """Run the stub server in a child process and return (process, base_url)"""
+    process = subprocess.Popen([sys.executable, STUB_SERVER, "--port", "0"], stdout=subprocess.PIPE, text=True)
+    return process, process.stdout.readline().strip()
+
+def control(base_url, path, **params):
+    with urllib.request.urlopen(f"{base_url}{path}?{urllib.parse.urlencode(params)}") as response:
+        return json.loads(response.read())
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(q * len(values)), len(values) - 1)]
+
+def bench_fetch(app, base_url, profile, args):
+    """Cold fetch+parse throughput for one profile's query"""
+    offset = app.TIMEZONE_OPTIONS[args.timezone]["offset"]
+    bd_now = datetime.now() - timedelta(minutes=offset)
+    control(base_url, "/_config", date=bd_now.strftime("%d/%m/%Y"), burst="", signals_per_day=args.signals_per_day)
+
+    query = app.SignalQuery.from_auto_settings(profile)
+    shard_size = app._setting_int(profile, "fetch_shard_size", app.FETCH_SHARD_SIZE)
+    concurrency = app._setting_int(profile, "fetch_concurrency", app.FETCH_CONCURRENCY)
+    app.fetch_query(query, shard_size, concurrency)  # Warm up the connection pool
+
+    parsed = 0
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    for _ in range(args.fetches):
+        app._response_cache.clear()  # Force a full download and parse every time
+        _, signals = app.fetch_query(query, shard_size, concurrency)
+        parsed += len(signals)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    times = [f"{minute // 60:02d}:{minute % 60:02d}" for minute in range(1440)]
+    started = time.perf_counter()
+    for _ in range(20):
+        for signal_time in times:
+            app.convert_to_indian_time(signal_time, args.timezone)
+    convert_rate = 20 * len(times) / (time.perf_counter() - started)
+
+    print(f"Fetch/parse: {args.fetches} fetches of {len(query.pairs.split(','))} pairs x {args.days} days")
+    print(f"{'fetches/s':<28} {args.fetches / elapsed:10.1f}")
+    print(f"{'signals parsed/s':<28} {parsed / elapsed:10.0f}")
+    print(f"{'latency per fetch':<28} {elapsed / args.fetches * 1000:10.2f} ms")
+    print(f"{'CPU per fetch':<28} {cpu / args.fetches * 1000:10.2f} ms")
+    print(f"{'convert_to_indian_time/s':<28} {convert_rate:10.0f}")
+
+async def run_bots(app, base_url, profiles, expected, timeout):
+    """Run the bot profiles until `expected` signals were delivered or timeout passed"""
+    task = asyncio.create_task(app.run_profiles_async(profiles))
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    stats = {"telegram": []}
+    while loop.time() < deadline:
+        await asyncio.sleep(0.25)
+        stats = await asyncio.to_thread(control, base_url, "/_stats")
+        if sum(photos for _, _, photos in stats["telegram"]) >= expected:
+            break
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+    return stats
+
+def bench_send(app, base_url, profiles, args):
+    """Schedule every pair to send `--lead` seconds from now and measure delivery"""
+    offset = app.TIMEZONE_OPTIONS[args.timezone]["offset"]
+    now = datetime.now()
+    send_moment = now + timedelta(seconds=args.lead)
+    exec_at = (send_moment + timedelta(minutes=1)).replace(second=0, microsecond=0) + timedelta(minutes=1)
+    send_before = (exec_at - send_moment).total_seconds() / 60
+    bd_exec = exec_at - timedelta(minutes=offset)
+
+    app._response_cache.clear()  # Do not let phase 1 responses stand in via the single-flight TTL
+    control(base_url, "/_reset")
+    control(base_url, "/_config", date=bd_exec.strftime("%d/%m/%Y"), burst=bd_exec.strftime("%H:%M"),
+            signals_per_day=args.signals_per_day)
+    for profile in profiles.values():
+        profile["send_before"] = repr(send_before)
+
+    expected = args.bots * args.pairs
+    cpu_started = time.process_time()
+    stats = asyncio.run(run_bots(app, base_url, profiles, expected, args.lead + args.timeout))
+    cpu = time.process_time() - cpu_started
+
+    send_epoch = send_moment.timestamp()
+    errors = []
+    for received_at, _, photos in stats["telegram"]:
+        errors.extend([received_at - send_epoch] * photos)
+    delivered = len(errors)
+    span = max(max(errors), 1e-3) if errors else 0.0
+
+    print(f"\nSchedule/send: {args.bots} bot(s) x {args.pairs} pairs, send_before {send_before:.2f} min"
+          f"{', coalesced' if args.coalesce else ''}")
+    print(f"{'delivered':<28} {delivered:10d} / {expected}")
+    print(f"{'Telegram calls':<28} {len(stats['telegram']):10d}")
+    if errors:
+        print(f"{'throughput':<28} {delivered / span:10.1f} signals/s")
+        print(f"{'send-time error p50':<28} {percentile(errors, 0.50) * 1000:10.1f} ms")
+        print(f"{'send-time error p99':<28} {percentile(errors, 0.99) * 1000:10.1f} ms")
+        print(f"{'send-time error max':<28} {max(errors) * 1000:10.1f} ms")
+    print(f"{'CPU per bot':<28} {cpu / args.bots * 1000:10.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bots", type=int, default=4, help="bot profiles (one chat each)")
+    parser.add_argument("--pairs", type=int, default=5, help="pairs per bot")
+    parser.add_argument("--days", type=int, default=3, help="days requested from the API")
+    parser.add_argument("--signals-per-day", type=int, default=24, help="signal lines per pair and day in a response")
+    parser.add_argument("--fetches", type=int, default=50, help="cold fetches in the fetch/parse phase")
+    parser.add_argument("--timezone", default="1", help="timezone option (see TIMEZONE_OPTIONS)")
+    parser.add_argument("--lead", type=float, default=5.0, help="seconds until the scheduled send moment")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds to wait for delivery after the send moment")
+    parser.add_argument("--coalesce", action="store_true", help="send same-minute signals as media groups")
+    args = parser.parse_args()
+
+    app = load_app()
+    workdir = tempfile.mkdtemp(prefix="growbot-bench-")
+    app.SIGNAL_CACHE_FILE = os.path.join(workdir, "signal_cache.sqlite3")
+    app.TELEGRAM_FILE_IDS_FILE = os.path.join(workdir, "telegram_file_ids.json")
+    app.SIGNAL_ARCHIVE_DIR = os.path.join(workdir, "signal_archive")
+    app.SIGNAL_HISTORY_FILE = os.path.join(workdir, "signal_history.sqlite3")
+    app.SENT_LEDGER_DIR = os.path.join(workdir, "sent_ledger")
+    app.DAEMON_MODE = True
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
+
+    process, base_url = start_stub()
+    try:
+        app.API_URL = base_url
+        app.TELEGRAM_API_URL = base_url
+
+        known = [pair for pair, _ in app.currency_pairs]
+        pairs = [known[i] if i < len(known) else f"BENCH{i}_otc" for i in range(args.pairs)]
+        profiles = {
+            f"bot{i}": dict(
+                app.DEFAULT_AUTO_BOT_SETTINGS,
+                pairs=",".join(pairs),
+                days=str(args.days),
+                timezone=args.timezone,
+                start_time="00:00",
+                end_time="23:59",
+                bot_token=f"{i}:bench",
+                channel_id=f"@bench{i}",
+                coalesce_signals="1" if args.coalesce else "0"
+            )
+            for i in range(args.bots)
+        }
+
+        bench_fetch(app, base_url, next(iter(profiles.values())), args)
+        bench_send(app, base_url, profiles, args)
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
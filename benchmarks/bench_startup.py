@@ -0,0 +1,75 @@
+"""Benchmark: cold start import cost of growup-mobile.py
+
+Loads the app in fresh interpreters under `python -X importtime` and sums
+the cumulative time of every top-level import the app triggers (interpreter
+startup and the benchmark helpers are excluded). Exits with status 1 when
+the best run exceeds the budget, so it can gate CI.
+
+Usage: python benchmarks/bench_startup.py [--repeat 5] [--budget-ms 40]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+MARKER = "-- app import --"
+
+# Runs in the child interpreter: everything after MARKER is caused by the app
+CHILD_CODE = f"""
+import sys, time
+sys.path.insert(0, {BENCH_DIR!r})
+from common import load_app
+sys.stderr.write({MARKER!r} + "\\n")
+started = time.perf_counter()
+load_app()
+sys.stderr.write("load_app %.3f\\n" % ((time.perf_counter() - started) * 1000))
+"""
+
+def measure_once():
+    """Return (import_ms, load_ms, [(cumulative_us, module)]) for one cold start"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_CODE],
+        capture_output=True, text=True, check=True, cwd=BENCH_DIR
+    )
+    lines = result.stderr.splitlines()
+    lines = lines[lines.index(MARKER) + 1:]
+
+    top_level = []
+    load_ms = 0.0
+    for line in lines:
+        if line.startswith("load_app "):
+            load_ms = float(line.split()[1])
+            continue
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # Nested imports are indented below their parent; only count top-level ones
+        if cumulative.strip().isdigit() and not name[1:].startswith(" "):
+            top_level.append((int(cumulative), name.strip()))
+    return sum(us for us, _ in top_level) / 1000, load_ms, top_level
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="cold starts to run (best is reported)")
+    parser.add_argument("--budget-ms", type=float, default=40.0, help="maximum allowed import time of the best run")
+    parser.add_argument("--top", type=int, default=8, help="slowest imports to list")
+    args = parser.parse_args()
+
+    runs = [measure_once() for _ in range(args.repeat)]
+    import_ms, load_ms, top_level = min(runs, key=lambda run: run[0])
+
+    print(f"Best of {args.repeat} cold starts:")
+    print(f"{'imports (-X importtime)':<28} {import_ms:8.2f} ms  (budget {args.budget_ms:.0f} ms)")
+    print(f"{'load_app() wall time':<28} {load_ms:8.2f} ms")
+    print("\nSlowest top-level imports:")
+    for us, name in sorted(top_level, reverse=True)[:args.top]:
+        print(f"  {name:<26} {us / 1000:8.2f} ms")
+
+    if import_ms > args.budget_ms:
+        print(f"\nFAIL: import time {import_ms:.2f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
+    print("\nOK: within budget")
+
+if __name__ == "__main__":
+    main()
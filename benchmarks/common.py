@@ -0,0 +1,31 @@
+"""Shared helpers for the benchmark scripts"""
+import os
+import sys
+import random
+import importlib.util
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_FILE = os.path.join(ROOT_DIR, "growup-mobile.py")
+
+def load_app():
+    """Import growup-mobile.py as a module (its file name is not importable directly)"""
+    spec = importlib.util.spec_from_file_location("growup_mobile", APP_FILE)
+    app = importlib.util.module_from_spec(spec)
+    sys.modules["growup_mobile"] = app
+    spec.loader.exec_module(app)
+
+    # DEFAULT_SETTINGS is normally created by the __main__ block
+    if not hasattr(app, "DEFAULT_SETTINGS"):
+        app.DEFAULT_SETTINGS = app.load_settings()
+    return app
+
+def make_signal_response(pairs, lines, date="16/01/2025", seed=1):
+    """Build a signal API style response with `lines` PA～pair～HH:MM～ACTION rows"""
+    rng = random.Random(seed)
+    rows = ["Signals:", f"Date: {date}", ""]
+    for _ in range(lines):
+        pair = rng.choice(pairs)
+        minute = rng.randrange(1440)
+        action = rng.choice(("CALL", "PUT"))
+        rows.append(f"PA～{pair}～{minute // 60:02d}:{minute % 60:02d}～{action}")
+    return "\n".join(rows) + "\n"
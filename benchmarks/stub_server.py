@@ -0,0 +1,139 @@
+"""Local stand-in for the signal API and the Telegram Bot API
+
+Signal API: any GET that is not a control or /bot path returns a
+"Signals:" response with `signals_per_day * days` PA～pair～HH:MM～ACTION
+lines per requested pair (Bangladesh time). One of them executes at the
+configured burst minute; the rest are spread over the day away from it.
+
+Telegram: GET /bot<token>/<method> answers like the Bot API and records
+(received_at, chat_id, photos) for every sendPhoto/sendMediaGroup/
+sendMessage call.
+
+Control: GET /_config?date=DD/MM/YYYY&burst=HH:MM&signals_per_day=N sets
+the response shape, GET /_stats returns the recorded calls as JSON and
+GET /_reset clears them.
+
+Usage: python benchmarks/stub_server.py [--port 0]  (prints the base URL)
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class StubState:
+    """Response shape and recorded Telegram calls, shared by all handler threads"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.date = time.strftime("%d/%m/%Y")
+        self.burst = None            # "HH:MM" every pair executes at, or None
+        self.signals_per_day = 24
+        self.api_requests = 0
+        self.telegram = []           # [received_at, chat_id, photos]
+        self._responses = {}
+
+    def signal_response(self, pairs, days):
+        """Build (and memoise) the response body for a pair list and day count"""
+        with self.lock:
+            self.api_requests += 1
+            key = (pairs, days, self.date, self.burst, self.signals_per_day)
+            body = self._responses.get(key)
+            if body is not None:
+                return body
+
+            rng = random.Random(f"{pairs}|{days}")
+            burst_minute = None
+            if self.burst:
+                hour, minute = map(int, self.burst.split(":"))
+                burst_minute = hour * 60 + minute
+
+            rows = ["Signals:", f"Date: {self.date}", ""]
+            for pair in filter(None, pairs.split(",")):
+                lines = max(self.signals_per_day * days, 1)
+                minutes = [] if burst_minute is None else [burst_minute]
+                while len(minutes) < lines:
+                    minute = rng.randrange(1440)
+                    # Keep background signals out of the burst window so only the burst is sent
+                    if burst_minute is None or abs(minute - burst_minute) > 5:
+                        minutes.append(minute)
+                for minute in minutes:
+                    action = rng.choice(("CALL", "PUT"))
+                    rows.append(f"PA～{pair}～{minute // 60:02d}:{minute % 60:02d}～{action}")
+            body = ("\n".join(rows) + "\n").encode("utf-8")
+            self._responses[key] = body
+            return body
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # Headers and body are separate writes; avoid the delayed-ACK stall
+    state = None
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        query = {key: values[-1] for key, values in urllib.parse.parse_qs(url.query).items()}
+
+        if url.path.startswith("/bot"):
+            body = self._telegram(url.path.rsplit("/", 1)[-1], query)
+        elif url.path == "/_config":
+            with self.state.lock:
+                self.state.date = query.get("date", self.state.date)
+                self.state.burst = query.get("burst") or None
+                self.state.signals_per_day = int(query.get("signals_per_day", self.state.signals_per_day))
+                self.state._responses.clear()
+            body = b"{}"
+        elif url.path == "/_stats":
+            with self.state.lock:
+                body = json.dumps({"api_requests": self.state.api_requests, "telegram": self.state.telegram}).encode()
+        elif url.path == "/_reset":
+            with self.state.lock:
+                self.state.api_requests = 0
+                self.state.telegram = []
+            body = b"{}"
+        else:
+            body = self.state.signal_response(query.get("pairs", ""), int(query.get("days", "1") or 1))
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _telegram(self, method, query):
+        photos = 1
+        if method == "sendMediaGroup":
+            photos = len(json.loads(query.get("media", "[]")))
+            result = [{"message_id": i, "photo": [{"file_id": f"stub-{i}"}]} for i in range(photos)]
+        elif method == "sendPhoto":
+            result = {"message_id": 1, "photo": [{"file_id": "stub"}]}
+        else:
+            result = {"message_id": 1}
+        with self.state.lock:
+            self.state.telegram.append([time.time(), query.get("chat_id"), photos])
+        return json.dumps({"ok": True, "result": result}).encode()
+
+    def log_message(self, *args):
+        pass
+
+def start(port=0):
+    """Serve in a background thread and return (server, base_url)"""
+    handler = type("Handler", (StubHandler,), {"state": StubState()})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=0, help="port to listen on (0 picks a free one)")
+    args = parser.parse_args()
+
+    server, base_url = start(args.port)
+    print(base_url, flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
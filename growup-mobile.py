@@ -1,20 +1,120 @@
 import os
-import socket
+import sys
 import json
-import requests
 import re
 import time
+import heapq
+import bisect
+import hashlib
+import threading
+import itertools
+import zlib
+import array
+import atexit
+import collections
+import importlib.util
 from datetime import datetime, timedelta
-from colorama import init, Fore, Style
-import telebot
-from telebot.apihelper import ApiTelegramException
-import sys
 import base64  # For basic encryption of stored passwords
-import codecs
-sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer)
 
-# Initialize colorama
-init(autoreset=True)
+_lazy_import_lock = threading.RLock()
+
+class _LazyModule:
+    """Stand-in for a module that imports it on first attribute access
+
+    The import runs under _lazy_import_lock, so threads touching the module
+    for the first time at once all wait for one complete import (unlike
+    importlib's LazyLoader before Python 3.12). The real module then replaces
+    the stand-in in this file's globals.
+    """
+
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            with _lazy_import_lock:
+                module = self._module
+                if module is None:
+                    module = importlib.import_module(self._name)
+                    if globals().get(self._alias) is self:
+                        globals()[self._alias] = module
+                    self._module = module
+        return getattr(module, attr)
+
+def _lazy_import(name, alias=None):
+    """Return a module that is only imported on first attribute access
+
+    Keeps heavy or rarely needed modules (requests, asyncio, sqlite3, ...)
+    out of the startup path. `alias` is the global name it is bound to.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if importlib.util.find_spec(name) is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    return _LazyModule(name, alias or name)
+
+requests = _lazy_import("requests")
+asyncio = _lazy_import("asyncio")
+sqlite3 = _lazy_import("sqlite3")
+logging = _lazy_import("logging")
+argparse = _lazy_import("argparse")
+colorama = _lazy_import("colorama")
+gzip = _lazy_import("gzip")
+html = _lazy_import("html")
+string = _lazy_import("string")
+try:
+    np = _lazy_import("numpy", "np")
+except ImportError:
+    np = None  # Optional: only backtesting needs NumPy
+
+class _LazyAnsi:
+    """Stand-in for colorama's Fore/Style that imports colorama on first use"""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        value = getattr(getattr(colorama, self._name), attr)
+        setattr(self, attr, value)
+        return value
+
+Fore = _LazyAnsi("Fore")
+Style = _LazyAnsi("Style")
+
+def init_terminal():
+    """Set up UTF-8 and colored output for the interactive app"""
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")
+    colorama.init(autoreset=True)
+
+# Runtime output: colored text for the interactive app, structured log lines under --daemon
+DAEMON_MODE = False
+
+def _log_value(value):
+    text = str(value)
+    if not text or any(char in text for char in ' "='):
+        return json.dumps(text, ensure_ascii=False)
+    return text
+
+def report(event, message=None, color=None, level=None, **fields):
+    """Report a runtime event
+
+    Interactive runs print `message` in `color`, a colorama Fore name such
+    as "RED" (green by default, nothing when message is None); daemon runs
+    log one "event=<event> key=value ..." line at `level` (INFO by default)
+    instead and never import colorama.
+    """
+    if DAEMON_MODE:
+        logging.getLogger("growbot").log(
+            level or logging.INFO,
+            " ".join(f"{key}={_log_value(value)}" for key, value in [("event", event)] + list(fields.items()))
+        )
+    elif message is not None:
+        print(getattr(Fore, color or "GREEN") + message + Style.RESET_ALL)
 
 def get_application_path():
     """Get the path where the application is running from (works in both script and exe)"""
@@ -44,14 +144,11 @@ DATA_DIR = os.path.join(APP_PATH, "data")
 
 # Create data directory if it doesn't exist
 try:
-    if not os.path.exists(DATA_DIR):
-        os.makedirs(DATA_DIR, exist_ok=True)
-    
-    # Test write access to the DATA_DIR
-    test_file = os.path.join(DATA_DIR, "test_write.tmp")
-    with open(test_file, 'w') as f:
-        f.write("test")
-    os.remove(test_file)
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+    # Check write access without creating and deleting a probe file
+    if not os.access(DATA_DIR, os.W_OK):
+        raise PermissionError(f"No write permission for {DATA_DIR}")
 except Exception as e:
     print(Fore.RED + f"Error accessing data directory: {str(e)}" + Style.RESET_ALL)
     print(Fore.YELLOW + "Application may have limited functionality due to permission issues." + Style.RESET_ALL)
@@ -70,6 +167,68 @@ except Exception as e:
 CREDENTIALS_FILE = os.path.join(DATA_DIR, "saved_credentials.json")
 DEFAULT_SETTINGS_FILE = os.path.join(DATA_DIR, "default_settings.json")
 AUTO_BOT_SETTINGS_FILE = os.path.join(DATA_DIR, "auto_bot_settings.json")
+BOT_PROFILES_DIR = os.path.join(DATA_DIR, "bot_profiles")  # One auto_bot_settings-style JSON per channel
+TELEGRAM_FILE_IDS_FILE = os.path.join(DATA_DIR, "telegram_file_ids.json")  # Uploaded image file_ids per bot
+SIGNAL_CACHE_FILE = os.path.join(DATA_DIR, "signal_cache.sqlite3")  # Raw API responses for offline replay
+SIGNAL_ARCHIVE_DIR = os.path.join(DATA_DIR, "signal_archive")  # Daily JSON Lines archive of fetched signals
+SIGNAL_HISTORY_FILE = os.path.join(DATA_DIR, "signal_history.sqlite3")  # Fetched and sent signals, indexed for queries
+SENT_LEDGER_DIR = os.path.join(DATA_DIR, "sent_ledger")  # Sent signal ids per bot profile and day
+
+# Auto bot scheduling
+AUTO_FETCH_INTERVAL = 30        # Seconds between signal refetches
+DISPLAY_REFRESH_INTERVAL = 120  # Seconds between status screen refreshes
+SEND_WINDOW_SECONDS = 30        # How late a signal may still be sent after its send moment
+SENT_LEDGER_DAYS = 3            # Days of sent signal ids kept (today included)
+
+# Shared HTTP client
+HTTP_POOL_SIZE = 10             # Keep-alive connections kept per host
+HTTP_TIMEOUT = (5, 15)          # (connect, read) timeout in seconds
+HTTP_RETRIES = 3                # Retries for connection errors and 5xx responses
+HTTP_BACKOFF = 0.5              # Exponential backoff factor between retries
+MAX_CONCURRENT_REQUESTS = 8     # In-flight API/Telegram requests across all bot profiles
+
+# Connectivity health, derived from real API/Telegram request outcomes
+HEALTH_FAILURE_THRESHOLD = 3    # Consecutive network failures before going offline
+HEALTH_TTL = 120                # Seconds a successful request vouches for the connection
+BACKOFF_BASE = 5                # First offline/error backoff in seconds, doubled per retry
+BACKOFF_MAX = 300               # Upper bound for the offline/error backoff in seconds
+
+# Telegram delivery
+TELEGRAM_API_URL = "https://api.telegram.org"
+TELEGRAM_GLOBAL_RATE = 30       # Messages per second across all chats
+TELEGRAM_CHAT_INTERVAL = 1.0    # Minimum seconds between messages to one chat
+TELEGRAM_MAX_ATTEMPTS = 5       # Delivery attempts for network, 5xx and 429 errors
+TELEGRAM_SEND_WORKERS = 2       # Threads draining the send queue
+AUTO_BOT_CONFIG_CACHE_SIZE = 64   # Parsed auto bot configs kept (one per settings snapshot or profile)
+CAPTION_TEMPLATE_CACHE_SIZE = 64  # Compiled caption templates kept (one per message settings and timezone)
+
+SETTINGS_CHECK_INTERVAL = 1.0   # Seconds between settings file change checks
+
+# Offline signal cache
+SIGNAL_CACHE_TTL = 2 * 24 * 3600          # Seconds a stored API response may be replayed
+SIGNAL_CACHE_MAX_BYTES = 20 * 1024 * 1024  # Stored response bodies beyond this are evicted oldest first
+SINGLE_FLIGHT_TTL = 5                      # Seconds a fetched response is shared with identical queries
+SHARED_FETCH_MAX_AGE = 0                   # Reuse responses stored this recently (by any process) instead of fetching; 0 = off
+
+# Signal archive
+SIGNAL_ARCHIVE_BUFFER = 500        # Buffered records that trigger a write
+SIGNAL_ARCHIVE_FLUSH_INTERVAL = 10 # Seconds buffered records may wait for a write
+SIGNAL_ARCHIVE_COMPRESS = False    # Write gzip-compressed day files (.jsonl.gz); --compress-archive
+SIGNAL_ARCHIVE_OPEN_DAYS = 7       # Most recent days whose archived signals are remembered for de-duplication
+
+# Supervisor (--supervisor)
+PROFILE_RESCAN_INTERVAL = 30    # Seconds between checks of BOT_PROFILES_DIR for added/changed/removed profiles
+WORKER_STABLE_SECONDS = 60      # A worker running this long resets its crash backoff
+
+# Metrics
+METRICS_DUMP_INTERVAL = 60      # Seconds between JSON metric dumps (--metrics-file)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)  # Seconds
+SKEW_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60)                         # Seconds late
+COUNT_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000)                   # Signals
+
+# Multi-pair fetch planner (overridable per settings file)
+FETCH_SHARD_SIZE = 10           # Pairs per API sub-request
+FETCH_CONCURRENCY = 4           # Parallel sub-requests per fetch
 
 def load_credentials():
     """Load saved credentials from file"""
@@ -126,6 +285,20 @@ def change_password(username, old_password, new_password):
         return True
     return False
 
+def saved_login():
+    """Return (username, expire_time) for valid, unexpired saved credentials, or None
+
+    Never prompts, so it is safe to use from --daemon.
+    """
+    creds = load_credentials()
+    username = creds.get("username")
+    if not creds.get("save_login") or username not in USERS or USERS[username]["password"] != creds.get("password"):
+        return None
+    expire_time = USERS[username]["expire_time"]
+    if datetime.now() > expire_time:
+        return None
+    return username, expire_time
+
 def login():
     """Login function with expiration check and saved credentials support."""
     # Load saved credentials
@@ -326,6 +499,64 @@ stocks_and_indices = [
     ("XAUUSD_otc", "Gold (OTC)"),
 ]
 
+# Compact signal representation
+# Pairs are stored as integer codes into PAIR_CODES (pre-seeded with every
+# known pair, extended on demand), times as minute-of-day and actions as
+# indexes into SIGNAL_ACTIONS.
+PAIR_CODES = [pair for pair, _ in currency_pairs + stocks_and_indices]
+_pair_index = {pair: code for code, pair in enumerate(PAIR_CODES)}
+_pair_index_lock = threading.Lock()
+
+SIGNAL_ACTIONS = ("N/A", "CALL", "PUT")
+ACTION_NONE, ACTION_CALL, ACTION_PUT = range(3)
+_action_index = {"CALL": ACTION_CALL, "PUT": ACTION_PUT}
+
+MINUTE_LABELS = tuple(f"{minute // 60:02d}:{minute % 60:02d}" for minute in range(1440))
+
+def intern_pair(pair):
+    """Return the integer code for a pair name, assigning a new one if unseen"""
+    code = _pair_index.get(pair)
+    if code is None:
+        with _pair_index_lock:
+            code = _pair_index.get(pair)
+            if code is None:
+                code = len(PAIR_CODES)
+                PAIR_CODES.append(pair)
+                _pair_index[pair] = code
+    return code
+
+class Signal:
+    """A single signal: pair code, local minute-of-day, action code and execution date"""
+    __slots__ = ("pair_code", "minute", "action_code", "date", "percentage")
+
+    def __init__(self, pair_code, minute, action_code, date=None, percentage=None):
+        self.pair_code = pair_code
+        self.minute = minute
+        self.action_code = action_code
+        self.date = date
+        self.percentage = percentage
+
+    @property
+    def pair(self):
+        return PAIR_CODES[self.pair_code]
+
+    @property
+    def time(self):
+        return MINUTE_LABELS[self.minute]
+
+    @property
+    def action(self):
+        return SIGNAL_ACTIONS[self.action_code]
+
+    @property
+    def key(self):
+        """Integer id of this signal, unique per date, minute, pair and action"""
+        day = self.date.toordinal() if self.date is not None else 0
+        return ((day * 1440 + self.minute) * 4 + self.action_code) << 20 | self.pair_code
+
+    def __repr__(self):
+        return f"Signal({self.pair}, {self.date} {self.time}, {self.action})"
+
 def display_pairs():
     """Display available currency pairs and stocks"""
     print(Fore.GREEN + "Available Currency Pairs (OTC):" + Style.RESET_ALL)
@@ -358,10 +589,315 @@ API_URL = _get_url()
 # Pastebin raw URLs
 PASTEBIN_MAINTENANCE_URL = "https://pastebin.com/raw/eqmdkZ0E"
 
+# Shared, pooled HTTP session used by every network call
+_http_session = None
+_http_session_lock = threading.Lock()  # Also serializes the lazy first import of requests
+_http_stats_lock = threading.Lock()
+HTTP_STATS = {
+    "requests": 0,       # Completed requests
+    "errors": 0,         # Requests that raised after all retries
+    # Pool hits/misses are approximate: they compare the pool's connection count before and
+    # after a request, so a connection opened by a concurrent request can count as this one's miss
+    "pool_hits": 0,      # Requests served over a reused keep-alive connection
+    "pool_misses": 0,    # Requests that had to open a new connection
+    "total_latency": 0.0,
+    "max_latency": 0.0
+}
+
+def get_http_session():
+    """Return the shared HTTP session, creating it on first use"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry = Retry(
+                    total=HTTP_RETRIES,
+                    backoff_factor=HTTP_BACKOFF,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=frozenset(["GET"]),
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+                # Telegram sends are not idempotent: a retried read timeout may post the message twice,
+                # so only connection failures are retried there.
+                telegram_retry = Retry(total=HTTP_RETRIES, connect=HTTP_RETRIES, read=0, backoff_factor=HTTP_BACKOFF,
+                                       raise_on_status=False)
+                telegram_adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                                               max_retries=telegram_retry)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.mount(TELEGRAM_API_URL, telegram_adapter)  # Longest matching prefix wins
+                _http_session = session
+    return _http_session
+
+def backoff_delay(attempt):
+    """Exponential backoff in seconds for the given 0-based retry attempt"""
+    return min(BACKOFF_BASE * 2 ** min(attempt, 16), BACKOFF_MAX)
+
+class ConnectionHealth:
+    """Connectivity state derived from the outcome of real HTTP requests
+
+    Acts as a circuit breaker: after HEALTH_FAILURE_THRESHOLD consecutive
+    network failures the circuit opens and allow_request() refuses callers
+    until an exponential backoff expires. A single caller is then let through
+    as a probe; a success closes the circuit, a failure reopens it for longer.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.failures = 0         # Consecutive network failures
+        self.trips = 0            # Times the circuit opened since the last success
+        self.open_until = 0.0     # time.monotonic() before which callers are refused
+        self.probing = False      # A half-open probe is in flight
+        self.last_success = None  # time.monotonic() of the last completed request
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.trips = 0
+            self.open_until = 0.0
+            self.probing = False
+            self.last_success = time.monotonic()
+
+    def record_failure(self):
+        with self._lock:
+            now = time.monotonic()
+            self.failures += 1
+            if self.failures >= HEALTH_FAILURE_THRESHOLD and (self.probing or now >= self.open_until):
+                self.open_until = now + backoff_delay(self.trips)
+                self.trips += 1
+                self.probing = False
+
+    def allow_request(self):
+        """Return False while the circuit is open; no network I/O"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.open_until:
+                return False
+            if self.trips:
+                # Half-open: this caller probes, everyone else waits for its outcome
+                self.probing = True
+                self.open_until = now + backoff_delay(self.trips - 1)
+            return True
+
+    def retry_in(self):
+        """Seconds until the circuit lets a request through again"""
+        with self._lock:
+            return max(self.open_until - time.monotonic(), 0.0)
+
+    def status(self):
+        """Return "online", "offline" or "unknown" when no recent request vouches either way"""
+        with self._lock:
+            if self.trips:
+                return "offline"
+            if self.last_success is not None and time.monotonic() - self.last_success <= HEALTH_TTL:
+                return "online"
+            return "unknown"
+
+CONNECTION_HEALTH = ConnectionHealth()
+
+def http_get(url, params=None, timeout=None, headers=None):
+    """GET a URL through the shared session and record pool, latency and health stats"""
+    session = get_http_session()
+    try:
+        pool = session.get_adapter(url).poolmanager.connection_from_url(url)
+        connections_before = pool.num_connections
+    except Exception:
+        pool = None
+        connections_before = 0
+
+    started = time.perf_counter()
+    try:
+        response = session.get(url, params=params, headers=headers, timeout=timeout or HTTP_TIMEOUT)
+    except requests.RequestException as e:
+        with _http_stats_lock:
+            HTTP_STATS["errors"] += 1
+        if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+            CONNECTION_HEALTH.record_failure()
+        raise
+
+    CONNECTION_HEALTH.record_success()
+    elapsed = time.perf_counter() - started
+    with _http_stats_lock:
+        HTTP_STATS["requests"] += 1
+        HTTP_STATS["total_latency"] += elapsed
+        HTTP_STATS["max_latency"] = max(HTTP_STATS["max_latency"], elapsed)
+        if pool is not None and pool.num_connections > connections_before:
+            HTTP_STATS["pool_misses"] += 1
+        else:
+            HTTP_STATS["pool_hits"] += 1
+    return response
+
+def get_http_stats():
+    """Return a snapshot of the HTTP client counters with average latency (pool hits/misses are approximate)"""
+    with _http_stats_lock:
+        stats = dict(HTTP_STATS)
+    stats["avg_latency"] = stats["total_latency"] / stats["requests"] if stats["requests"] else 0.0
+    return stats
+
+class Metrics:
+    """Process-wide counters, histograms and sampled gauges
+
+    Updates are a dict lookup and an add under one lock, cheap enough for
+    the hot path. render() produces the Prometheus text format and
+    snapshot() a JSON-serialisable dict.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._meta = {}    # name -> (type, help, buckets)
+        self._series = {}  # name -> {label tuple: value, or per-bucket counts + [sum, count]}
+        self._gauges = {}  # name -> callable sampled at render/snapshot time
+
+    def counter(self, name, help_text):
+        self._meta[name] = ("counter", help_text, None)
+        self._series[name] = {}
+
+    def histogram(self, name, help_text, buckets):
+        self._meta[name] = ("histogram", help_text, buckets)
+        self._series[name] = {}
+
+    def gauge(self, name, help_text, sample, kind="gauge"):
+        self._meta[name] = (kind, help_text, None)
+        self._gauges[name] = sample
+
+    def inc(self, name, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._series[name]
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        buckets = self._meta[name][2]
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._series[name]
+            counts = series.get(key)
+            if counts is None:
+                counts = series[key] = [0] * (len(buckets) + 1) + [0.0, 0]
+            counts[bisect.bisect_left(buckets, value)] += 1
+            counts[-2] += value
+            counts[-1] += 1
+
+    def _collect(self):
+        with self._lock:
+            series = {name: {key: list(value) if isinstance(value, list) else value for key, value in values.items()}
+                      for name, values in self._series.items()}
+        for name, sample in self._gauges.items():
+            try:
+                series[name] = {(): sample()}
+            except Exception:
+                series[name] = {}
+        return series
+
+    def snapshot(self):
+        """Current values as {name: [{"labels": {...}, ...}]}"""
+        result = {}
+        for name, values in self._collect().items():
+            buckets = self._meta[name][2]
+            entries = result[name] = []
+            for key, value in values.items():
+                if buckets is None:
+                    entries.append({"labels": dict(key), "value": value})
+                else:
+                    cumulative = list(itertools.accumulate(value[:len(buckets) + 1]))
+                    entries.append({
+                        "labels": dict(key),
+                        "buckets": dict(zip([str(bound) for bound in buckets] + ["+Inf"], cumulative)),
+                        "sum": value[-2],
+                        "count": value[-1]
+                    })
+        return result
+
+    def render(self):
+        """Prometheus text exposition format"""
+        def labels_text(pairs):
+            if not pairs:
+                return ""
+            escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+            return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + "}"
+
+        lines = []
+        for name, values in self._collect().items():
+            kind, help_text, buckets = self._meta[name]
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in sorted(values.items()):
+                if buckets is None:
+                    lines.append(f"{name}{labels_text(key)} {value}")
+                    continue
+                cumulative = list(itertools.accumulate(value[:len(buckets) + 1]))
+                for bound, count in zip([str(bound) for bound in buckets] + ["+Inf"], cumulative):
+                    lines.append(f"{name}_bucket{labels_text(key + (('le', bound),))} {count}")
+                lines.append(f"{name}_sum{labels_text(key)} {value[-2]}")
+                lines.append(f"{name}_count{labels_text(key)} {value[-1]}")
+        return "\n".join(lines) + "\n"
+
+METRICS = Metrics()
+METRICS.histogram("growbot_fetch_seconds", "Signal query fetch latency including all shards", LATENCY_BUCKETS)
+METRICS.counter("growbot_fetch_errors_total", "Signal queries that failed")
+METRICS.counter("growbot_fetch_dedup_total", "API requests saved by single-flight sharing (inflight or ttl)")
+METRICS.counter("growbot_fetch_replays_total", "Signal queries answered from a stored response while the API was unreachable")
+METRICS.histogram("growbot_parse_seconds", "Time to parse one signal API response", LATENCY_BUCKETS)
+METRICS.histogram("growbot_signals_per_fetch", "Signals returned by one signal query", COUNT_BUCKETS)
+METRICS.histogram("growbot_send_seconds", "Telegram send latency from enqueue to delivery", LATENCY_BUCKETS)
+METRICS.histogram("growbot_send_skew_seconds", "Delivery time minus the send moment implied by send_before", SKEW_BUCKETS)
+METRICS.counter("growbot_signals_sent_total", "Signals delivered to Telegram")
+METRICS.counter("growbot_signals_failed_total", "Signals given up on after retries")
+METRICS.counter("growbot_telegram_errors_total", "Failed Telegram API calls by error code (0 = network)")
+METRICS.counter("growbot_loop_errors_total", "Unexpected errors in the auto bot loops")
+METRICS.gauge("growbot_send_queue_depth", "Telegram jobs waiting in the send queue",
+              lambda: _send_queue.depth() if _send_queue is not None else 0)
+METRICS.gauge("growbot_connection_online", "1 while the connection circuit is closed, 0 while offline",
+              lambda: 0 if CONNECTION_HEALTH.status() == "offline" else 1)
+METRICS.gauge("growbot_replay_age_seconds", "Age of the oldest stored response replayed in place of the API (0 = live)",
+              lambda: get_replay_age() or 0)
+METRICS.gauge("growbot_http_requests_total", "Completed HTTP requests", lambda: get_http_stats()["requests"], "counter")
+METRICS.gauge("growbot_http_errors_total", "HTTP requests that raised after retries", lambda: get_http_stats()["errors"], "counter")
+
+def start_metrics_server(port, host="127.0.0.1"):
+    """Serve METRICS.render() at http://host:port/metrics from a background thread"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = METRICS.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+def start_metrics_dump(path, interval=METRICS_DUMP_INTERVAL):
+    """Write METRICS.snapshot() as JSON to `path` every `interval` seconds"""
+    def dump():
+        while True:
+            time.sleep(interval)
+            try:
+                write_json_atomic(path, {"time": datetime.now().isoformat(timespec="seconds"), "metrics": METRICS.snapshot()})
+            except OSError as e:
+                report("metrics_dump_error", level=logging.ERROR, file=path, error=e)
+
+    threading.Thread(target=dump, name="metrics-dump", daemon=True).start()
+
 def check_maintenance_mode():
     """Check if the software is in maintenance mode"""
     try:
-        response = requests.get(PASTEBIN_MAINTENANCE_URL)
+        response = http_get(PASTEBIN_MAINTENANCE_URL)
         if response.status_code == 200:
             maintenance_data = response.text.strip()
             if "PANNEL ON/OFF" in maintenance_data:
@@ -388,12 +924,12 @@ def check_mac_in_pastebin(mac_address):
 
 # Helper Functions
 def is_connected():
-    """Check if the system is connected to the internet."""
-    try:
-        socket.create_connection(("www.google.com", 80), timeout=5)
-        return True
-    except OSError:
-        return False
+    """Check if the system is connected to the internet.
+
+    Answers from CONNECTION_HEALTH, which tracks real API and Telegram
+    requests, so no probe connection is opened.
+    """
+    return CONNECTION_HEALTH.allow_request()
 
 def check_session(username):
     """Check if the user's session is still valid."""
@@ -427,38 +963,79 @@ TIMEZONE_OPTIONS = {
     "3": {"name": "Pakistan", "offset": -60, "display": "UTC +5:00"}  # 1 hour behind Bangladesh
 }
 
-def convert_to_indian_time(signal_time):
+BD_UTC_OFFSET = 360  # Signal API times are in Bangladesh time (UTC+6:00)
+
+def get_timezone_info(timezone_choice, default="1"):
+    """Return the {name, offset, display} entry for a timezone choice
+
+    Accepts a TIMEZONE_OPTIONS key or an arbitrary UTC offset such as
+    "UTC+5:45" or "-03:00". Invalid choices fall back to `default`
+    (None if default is None).
+    """
+    if timezone_choice in TIMEZONE_OPTIONS:
+        return TIMEZONE_OPTIONS[timezone_choice]
+
+    match = re.fullmatch(r"\s*(?:UTC)?\s*([+-])(\d{1,2})(?::(\d{2}))?\s*", str(timezone_choice or ""), re.IGNORECASE)
+    if match and int(match.group(2)) <= 14 and int(match.group(3) or 0) < 60:
+        sign = -1 if match.group(1) == "-" else 1
+        hours = int(match.group(2))
+        minutes = int(match.group(3) or 0)
+        utc_offset = sign * (hours * 60 + minutes)
+        return {
+            "name": "Custom",
+            "offset": utc_offset - BD_UTC_OFFSET,
+            "display": f"UTC {match.group(1)}{hours}:{minutes:02d}"
+        }
+
+    return TIMEZONE_OPTIONS[default] if default is not None else None
+
+# Precomputed Bangladesh minute-of-day -> local time tables, one per offset
+_timezone_tables = {}
+
+def get_timezone_table(offset_minutes):
+    """Return (minutes, labels, day_shifts) tuples indexed by Bangladesh minute-of-day
+
+    minutes[m] is the local minute-of-day, labels[m] its "HH:MM" text and
+    day_shifts[m] the day rollover (-1, 0 or +1) relative to the Bangladesh date.
+    """
+    table = _timezone_tables.get(offset_minutes)
+    if table is None:
+        minutes = []
+        labels = []
+        day_shifts = []
+        for minute_of_day in range(1440):
+            day_shift, local_minute = divmod(minute_of_day + offset_minutes, 1440)
+            minutes.append(local_minute)
+            labels.append(MINUTE_LABELS[local_minute])
+            day_shifts.append(day_shift)
+        table = (tuple(minutes), tuple(labels), tuple(day_shifts))
+        _timezone_tables[offset_minutes] = table
+    return table
+
+def convert_minutes_batch(minutes_of_day, timezone_choice="1"):
+    """Convert Bangladesh minute-of-day integers to (local_minute, day_shift) pairs"""
+    local_minutes, _, day_shifts = get_timezone_table(get_timezone_info(timezone_choice)["offset"])
+    return [(local_minutes[m], day_shifts[m]) for m in minutes_of_day]
+
+def convert_times_batch(signal_times, timezone_choice="1"):
+    """Convert Bangladesh "HH:MM" strings to (local "HH:MM", day_shift) pairs"""
+    _, labels, day_shifts = get_timezone_table(get_timezone_info(timezone_choice)["offset"])
+    converted = []
+    for signal_time in signal_times:
+        hour, minute = signal_time.split(":")
+        minute_of_day = int(hour) * 60 + int(minute)
+        converted.append((labels[minute_of_day], day_shifts[minute_of_day]))
+    return converted
+
+def convert_to_indian_time(signal_time, timezone_choice):
     """Converts UTC+6:00 (Bangladesh) time to selected timezone"""
-    global DEFAULT_SETTINGS
-    
-    # Parse the input time (which is in UTC+6:00)
-    bd_time = datetime.strptime(signal_time, "%H:%M")
-    bd_time = bd_time.replace(year=2025, month=1, day=16)  # Use current date
-    
-    # Get timezone offset in minutes relative to Bangladesh time
-    try:
-        timezone_choice = DEFAULT_SETTINGS.get("timezone", "1")  # Default to India if not set
-        offset_minutes = TIMEZONE_OPTIONS[timezone_choice]["offset"]
-    except (KeyError, TypeError):
-        timezone_choice = "1"  # Fallback to India
-        offset_minutes = TIMEZONE_OPTIONS["1"]["offset"]
-        DEFAULT_SETTINGS["timezone"] = timezone_choice  # Set default
-    
-    # Convert time by applying the offset relative to Bangladesh time
-    converted_time = bd_time + timedelta(minutes=offset_minutes)
-    return converted_time.strftime("%H:%M")
+    return convert_times_batch([signal_time], timezone_choice)[0][0]
 
-def print_table(signals, api_date):
+def print_table(signals, api_date, timezone_choice):
     """Print the signals in a formatted table"""
-    try:
-        timezone_choice = DEFAULT_SETTINGS.get("timezone", "1")
-        timezone_display = TIMEZONE_OPTIONS[timezone_choice]["display"]
-        country_name = TIMEZONE_OPTIONS[timezone_choice]["name"]
-    except (KeyError, TypeError):
-        timezone_choice = "1"  # Fallback to India
-        timezone_display = TIMEZONE_OPTIONS["1"]["display"]
-        country_name = TIMEZONE_OPTIONS["1"]["name"]
-        DEFAULT_SETTINGS["timezone"] = timezone_choice  # Set default
+    timezone_info = get_timezone_info(timezone_choice)
+    timezone_display = timezone_info["display"]
+    country_name = timezone_info["name"]
     
     print(Fore.GREEN + " ")
     print(Fore.CYAN + "╔════════✰═══════════╗" + Style.RESET_ALL)
@@ -476,9 +1053,9 @@ def print_table(signals, api_date):
 
     # Print the signal data in table format
     for signal in signals:
-        pair = signal['pair']
-        time = signal['time']
-        action = signal['action']
+        pair = signal.pair
+        time = signal.time
+        action = signal.action
         color = Fore.GREEN if action == "CALL" else Fore.RED
 
         print(f"| {pair:<12} | {time} | {color}{action}{Style.RESET_ALL} |")
@@ -487,191 +1064,1564 @@ def print_table(signals, api_date):
     print(Fore.GREEN + " " + Style.RESET_ALL)
     print(Fore.RED + " RULE : IF ENTRY CANDEL GAPUP OR GAP DOWN TO MUCH THAN DON'T TAKE TRADE. " + Style.RESET_ALL)
 
-def send_to_telegram(message, signal_data=None, send_before=None):
-    """Send signal message to Telegram channel"""
+def telegram_request(bot_token, method, params):
+    """Call a Telegram Bot API method and return its decoded JSON reply"""
+    response = http_get(f"{TELEGRAM_API_URL}/bot{bot_token}/{method}", params=params)
     try:
-        # Load auto bot settings for customized message format
-        auto_settings = load_auto_bot_settings()
-        
-        bot_token = DEFAULT_SETTINGS.get('telegram_bot_token', '')
-        channel = DEFAULT_SETTINGS.get('telegram_channel', '')
-        
-        if not bot_token or not channel:
-            print(Fore.RED + "\nError: Telegram settings not configured." + Style.RESET_ALL)
-            return False
-            
-        # Base URL for Telegram Bot API
-        base_url = f"https://api.telegram.org/bot{bot_token}"
-        
-        # If we have signal data, send image with detailed caption
-        if signal_data:
-            action = signal_data.get('action', '').upper()
-            signal_time = signal_data.get('time', '')
-            pair = signal_data.get('pair', '')
-            percentage = signal_data.get('percentage', DEFAULT_SETTINGS['min_percentage'])
-            
-            # Calculate timezone
-            tz_option = TIMEZONE_OPTIONS.get(DEFAULT_SETTINGS['timezone'], TIMEZONE_OPTIONS['1'])
-            tz_display = tz_option['display']  # This will be in format "UTC +5:30"
-            
-            # Get customized settings from auto bot settings
-            alert_title = auto_settings.get('alert_title', 'UPCOMING SIGNAL ALERT')
-            call_emoji = auto_settings.get('call_emoji', '🟢')
-            put_emoji = auto_settings.get('put_emoji', '🔴')
-            martingale_steps = auto_settings.get('martingale_steps', '1 Step')
-            signal_rules = auto_settings.get('signal_rules', ["If the previous candle is weak, the signal should be avoided", "Follow Trend"])
-            bot_signature = auto_settings.get('bot_signature', 'Generated by GrowUp Future Signals')
-            
-            image_url = ""
-            emoji = ""
-            if action == "CALL":
-                image_url = auto_settings.get('call_image_url', 'https://i.ibb.co/Q8L6mk5/Growth.png')
-                emoji = call_emoji
-            elif action == "PUT":
-                image_url = auto_settings.get('put_image_url', 'https://i.ibb.co/1vsFM2N/Growth-1.png')
-                emoji = put_emoji
-                
-            if image_url:
-                # Build rules text
-                rules_text = ""
-                for rule in signal_rules:
-                    rules_text += f"{rule}\n"
-                
-                caption = f"""
-{emoji} <b>{alert_title}</b> {emoji}
+        return response.json()
+    except ValueError:
+        return {"ok": False, "error_code": response.status_code, "description": response.text}
+
+def _resolve_telegram_target(profile=None):
+    """Return (message_settings, bot_token, channel, timezone_choice) for a profile or the global settings"""
+    if profile is not None:
+        return profile, profile.get('bot_token', ''), profile.get('channel_id', ''), str(profile.get('timezone', '1'))
+
+    # Auto bot settings for customized message format (cached, reloaded when the file changes).
+    # Their timezone is the one the auto bot fetches signal times in.
+    auto_settings = AUTO_BOT_SETTINGS_STORE.snapshot()
+    return (
+        auto_settings,
+        DEFAULT_SETTINGS.get('telegram_bot_token', ''),
+        DEFAULT_SETTINGS.get('telegram_channel', ''),
+        str(auto_settings.get('timezone', '1'))
+    )
+
+# Signal alert captions
+# The static part of a caption (title, emojis, rules, signature, timezone
+# label) is compiled once per settings into the literal text around the
+# per-signal fields, so a send only joins time, pair and minutes in.
+TELEGRAM_HTML_TAGS = {
+    "b", "strong", "i", "em", "u", "ins", "s", "strike", "del", "span", "tg-spoiler",
+    "a", "tg-emoji", "code", "pre", "blockquote"
+}
+TELEGRAM_HTML_ENTITIES = {"lt", "gt", "amp", "quot"}
 
-> <b>⏰ Execution Time: {signal_time} ({tz_display})</b>
-> <b>📊 Pair: {pair}</b>
-> <b>🔃 Auto Martingle: {martingale_steps}</b>
+_html_token = re.compile(r"<(/?)([A-Za-z][\w-]*)([^<>]*)>|&(?:#\d+|#x[0-9A-Fa-f]+|(\w+));|[<&]")
+
+_caption_templates = {}
+_caption_templates_lock = threading.Lock()
+
+def telegram_html_error(text):
+    """Return why Telegram's HTML parse mode would reject text, or None if it is valid"""
+    open_tags = []
+    for match in _html_token.finditer(text):
+        closing, tag, attributes, entity = match.groups()
+        if tag is None:
+            if match.group() in ("<", "&"):
+                return f"unescaped {match.group()!r} at position {match.start()} (use &lt; or &amp;)"
+            if entity is not None and entity not in TELEGRAM_HTML_ENTITIES:
+                return f"unsupported entity &{entity};"
+            continue
+
+        tag = tag.lower()
+        if tag not in TELEGRAM_HTML_TAGS:
+            return f"unsupported tag <{tag}>"
+        if closing:
+            if not open_tags or open_tags[-1] != tag:
+                return f"unexpected </{tag}>"
+            open_tags.pop()
+        elif tag == "a" and "href=" not in attributes:
+            return "<a> needs an href"
+        elif tag == "span" and "tg-spoiler" not in attributes:
+            return '<span> needs class="tg-spoiler"'
+        else:
+            open_tags.append(tag)
+    if open_tags:
+        return f"unclosed <{open_tags[-1]}>"
+    return None
+
+def _caption_fields(settings):
+    """Static caption settings, with their defaults"""
+    return (
+        settings.get('alert_title', 'UPCOMING SIGNAL ALERT'),
+        settings.get('call_emoji', '🟢'),
+        settings.get('put_emoji', '🔴'),
+        settings.get('martingale_steps', '1 Step'),
+        tuple(settings.get('signal_rules', ["If the previous candle is weak, the signal should be avoided", "Follow Trend"])),
+        settings.get('bot_signature', 'Generated by GrowUp Future Signals'),
+        settings.get('call_image_url', 'https://i.ibb.co/Q8L6mk5/Growth.png'),
+        settings.get('put_image_url', 'https://i.ibb.co/1vsFM2N/Growth-1.png')
+    )
+
+def _compile_caption(fields, tz_display, escape):
+    """{action: (image_url, literal parts around time, pair and minutes)} for caption fields"""
+    alert_title, call_emoji, put_emoji, martingale_steps, signal_rules, bot_signature, call_image_url, put_image_url = fields
+
+    def static(text):
+        text = str(text)
+        if escape:
+            text = html.escape(text, quote=False)
+        return text.replace("{", "{{").replace("}", "}}")
+
+    rules_text = "".join(f"{static(rule)}\n" for rule in signal_rules)
+    templates = {}
+    for action, emoji, image_url in (("CALL", call_emoji, call_image_url), ("PUT", put_emoji, put_image_url)):
+        if not image_url:
+            continue
+        emoji = static(emoji)
+        template = f"""
+{emoji} <b>{static(alert_title)}</b> {emoji}
+
+> <b>⏰ Execution Time: {{time}} ({static(tz_display)})</b>
+> <b>📊 Pair: {{pair}}</b>
+> <b>🔃 Auto Martingle: {static(martingale_steps)}</b>
 > <b>📈 Action: {action}</b>
 
-⚠️ <i>Get ready! Signal will execute in {int(send_before)} minutes!</i>
+⚠️ <i>Get ready! Signal will execute in {{minutes}} minutes!</i>
 ‼️ RULE ‼️ 
 {rules_text}
-<b>🤖 {bot_signature}</b>"""
-
-                # Send image with caption
-                params = {
-                    'chat_id': channel,
-                    'photo': image_url,
-                    'caption': caption,
-                    'parse_mode': 'HTML'
-                }
-                response = requests.get(f"{base_url}/sendPhoto", params=params)
-                if response.json().get('ok'):
-                    return True
-                else:
-                    print(Fore.RED + f"\nError sending image to Telegram: {response.text}" + Style.RESET_ALL)
-                    return False
-            
-        # If no signal data, just send a text message
-        elif message:
-            params = {
-                'chat_id': channel,
-                'text': message,
-                'parse_mode': 'HTML'
+<b>🤖 {static(bot_signature)}</b>"""
+        # Escaped braces come back as separate literals; merge everything between fields
+        parts = [""]
+        for literal, field, _, _ in string.Formatter().parse(template):
+            parts[-1] += literal
+            if field is not None:
+                parts.append("")
+        templates[action] = (image_url, tuple(parts))
+    return templates
+
+def _render_caption(parts, signal_time, pair, minutes):
+    head, after_time, after_pair, tail = parts
+    return f"{head}{signal_time}{after_time}{pair}{after_pair}{minutes}{tail}"
+
+def caption_template_error(settings, timezone_choice):
+    """Return why the caption for these settings is not valid Telegram HTML, or None"""
+    tz_display = get_timezone_info(timezone_choice)['display']
+    for _, parts in _compile_caption(_caption_fields(settings), tz_display, escape=False).values():
+        error = telegram_html_error(_render_caption(parts, "00:00", "PAIR", 1))
+        if error:
+            return error
+    return None
+
+def get_caption_templates(settings, timezone_choice):
+    """Compiled {action: (image_url, caption parts)} for message settings
+
+    Templates are cached per FrozenSettings object (a settings snapshot or
+    bot profile) and timezone; other mappings are compiled on every call.
+    Settings whose text is not valid Telegram HTML are reported once and
+    compiled with their text escaped, so the send itself cannot fail on it.
+    """
+    cacheable = isinstance(settings, FrozenSettings)
+    key = (settings, timezone_choice)
+    if cacheable:
+        templates = _caption_templates.get(key)
+        if templates is not None:
+            return templates
+
+    error = caption_template_error(settings, timezone_choice)
+    if error:
+        report("caption_template_error", f"\nSignal message is not valid Telegram HTML ({error}); sending it escaped.",
+               "RED", logging.WARNING, error=error)
+    templates = _compile_caption(_caption_fields(settings), get_timezone_info(timezone_choice)['display'], escape=error is not None)
+    if cacheable:
+        with _caption_templates_lock:
+            if len(_caption_templates) >= CAPTION_TEMPLATE_CACHE_SIZE:
+                _caption_templates.clear()
+            _caption_templates[key] = templates
+    return templates
+
+def build_signal_photo(signal_data, send_before, auto_settings, timezone_choice):
+    """Return (image_url, caption) for a signal alert; image_url is empty for actions without an image"""
+    entry = get_caption_templates(auto_settings, timezone_choice).get(signal_data.action)
+    if entry is None:
+        return "", None
+    image_url, parts = entry
+    return image_url, _render_caption(parts, signal_data.time, signal_data.pair, int(send_before))
+
+# Telegram file_ids of already uploaded signal images, keyed by "<bot id>|<image url>".
+# file_ids are only valid for the bot that uploaded them, so the bot id is part of the key.
+_file_ids = None
+_file_ids_lock = threading.Lock()
+
+def _file_id_key(bot_token, image_url):
+    return f"{bot_token.split(':')[0]}|{image_url}"
+
+def _load_file_ids():
+    """Load the persisted file_id cache on first use (call with _file_ids_lock held)"""
+    global _file_ids
+    if _file_ids is None:
+        try:
+            with open(TELEGRAM_FILE_IDS_FILE, 'r') as f:
+                _file_ids = json.load(f)
+        except (OSError, ValueError):
+            _file_ids = {}
+    return _file_ids
+
+def _save_file_ids():
+    """Persist the file_id cache (call with _file_ids_lock held)"""
+    try:
+        write_json_atomic(TELEGRAM_FILE_IDS_FILE, _file_ids)
+    except OSError as e:
+        report("file_ids_save_error", f"\nError saving Telegram file ids: {str(e)}", "RED", logging.ERROR, error=e)
+
+def get_photo_reference(bot_token, image_url):
+    """Return the cached Telegram file_id for an image, or the URL if it was never uploaded"""
+    with _file_ids_lock:
+        return _load_file_ids().get(_file_id_key(bot_token, image_url), image_url)
+
+def remember_photo_ids(bot_token, image_urls, result):
+    """Store file_ids from a sendPhoto/sendMediaGroup reply for images not cached yet"""
+    messages = result.get("result")
+    if isinstance(messages, dict):
+        messages = [messages]
+    if not isinstance(messages, list):
+        return
+
+    with _file_ids_lock:
+        file_ids = _load_file_ids()
+        changed = False
+        for image_url, message in zip(image_urls, messages):
+            photo_sizes = message.get("photo") if isinstance(message, dict) else None
+            key = _file_id_key(bot_token, image_url)
+            if photo_sizes and key not in file_ids:
+                file_ids[key] = photo_sizes[-1]["file_id"]
+                changed = True
+        if changed:
+            _save_file_ids()
+
+# Bad Request descriptions that blame the photo reference rather than the message itself
+_file_id_error = re.compile(r"file identifier|file_id|FILE_REFERENCE|wrong remote file|MEDIA_EMPTY|PHOTO_INVALID", re.IGNORECASE)
+
+def _is_file_id_error(result):
+    """True if a failed Bot API reply says the sent file_id (not the caption or chat) was bad"""
+    return bool(_file_id_error.search(str(result.get("description", ""))))
+
+def forget_photo_ids(image_urls, bot_token=None):
+    """Drop cached file_ids for the given image URLs (for every bot unless bot_token is given)"""
+    image_urls = set(image_urls)
+    with _file_ids_lock:
+        file_ids = _load_file_ids()
+        prefix = _file_id_key(bot_token, "") if bot_token else ""
+        stale = [key for key in file_ids if key.startswith(prefix) and key.split("|", 1)[1] in image_urls]
+        for key in stale:
+            del file_ids[key]
+        if stale:
+            _save_file_ids()
+
+def _signal_exec_at(signal, now):
+    """Execution datetime of a signal; undated signals take the occurrence of their minute nearest to now"""
+    if signal.date is not None:
+        return datetime.combine(signal.date, datetime.min.time()) + timedelta(minutes=signal.minute)
+    exec_at = now.replace(hour=signal.minute // 60, minute=signal.minute % 60, second=0, microsecond=0)
+    if exec_at - now > timedelta(hours=12):
+        exec_at -= timedelta(days=1)
+    elif now - exec_at > timedelta(hours=12):
+        exec_at += timedelta(days=1)
+    return exec_at
+
+class TelegramSendQueue:
+    """Outbound Telegram queue with per-chat and global rate limits and retry
+
+    Jobs are kept in a heap ordered by the time they may next be attempted.
+    Worker threads take the earliest ready job, wait for a global send slot
+    and the chat's own spacing, and honour retry_after from 429 replies.
+    Every failed attempt counts toward TELEGRAM_MAX_ATTEMPTS, and a job whose
+    signal has already executed is dropped instead of sent late.
+    """
+
+    def __init__(self, workers=TELEGRAM_SEND_WORKERS):
+        self._jobs = []  # Heap of (ready_at, seq, job)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._chat_ready_at = {}  # chat_id -> monotonic time the chat may receive again
+        self._next_global_slot = 0.0
+        self._latencies = collections.deque(maxlen=1000)
+        self.stats = {"sent": 0, "failed": 0, "retries": 0, "rate_limited": 0, "stale": 0}
+        for index in range(workers):
+            threading.Thread(target=self._worker, name=f"telegram-send-{index}", daemon=True).start()
+
+    def submit_signals(self, signals, send_before, profile=None, on_done=None, timezone_choice=None):
+        """Queue alerts for signals due together; on_done(signal, ok) is called per signal
+
+        timezone_choice is the timezone the signal times were converted to
+        (default: the profile's or auto bot's). With the 'coalesce_signals'
+        setting enabled, signals executing in the same minute are sent as one
+        media group (up to 10 photos).
+        """
+        auto_settings, bot_token, channel, target_timezone = _resolve_telegram_target(profile)
+        timezone_choice = timezone_choice or target_timezone
+        if not bot_token or not channel:
+            print(Fore.RED + "\nError: Telegram settings not configured." + Style.RESET_ALL)
+            for signal in signals:
+                if on_done:
+                    on_done(signal, False)
+            return
+
+        photos = []
+        for signal in signals:
+            image_url, caption = build_signal_photo(signal, send_before, auto_settings, timezone_choice)
+            if image_url:
+                photos.append((signal, image_url, caption))
+            elif on_done:
+                on_done(signal, True)  # Nothing to send for signals without an action
+
+        groups = []
+        if str(auto_settings.get('coalesce_signals', '0')) == '1':
+            by_minute = {}
+            for photo in photos:
+                by_minute.setdefault((photo[0].date, photo[0].minute), []).append(photo)
+            for same_minute in by_minute.values():
+                groups.extend(same_minute[i:i + 10] for i in range(0, len(same_minute), 10))
+        else:
+            groups = [[photo] for photo in photos]
+
+        now = time.monotonic()
+        wall_now = datetime.now()
+        for group in groups:
+            job = {
+                "bot_token": bot_token,
+                "chat_id": channel,
+                "photos": group,  # [(signal, image_url, caption)]
+                "signals": [photo[0] for photo in group],
+                "on_done": on_done,
+                "enqueued_at": now,
+                "expires_at": min(_signal_exec_at(photo[0], wall_now) for photo in group),
+                "send_before": send_before,
+                "attempts": 0,
+                "use_file_ids": True
             }
-            response = requests.get(f"{base_url}/sendMessage", params=params)
-            if response.json().get('ok'):
-                return True
+            self._push(now, job)
+
+    def _request_for(self, job):
+        """Build (method, params, references) for a job, using cached file_ids when allowed"""
+        references = [
+            get_photo_reference(job["bot_token"], image_url) if job["use_file_ids"] else image_url
+            for _, image_url, _ in job["photos"]
+        ]
+        if len(job["photos"]) == 1:
+            _, image_url, caption = job["photos"][0]
+            params = {'chat_id': job["chat_id"], 'photo': references[0], 'caption': caption, 'parse_mode': 'HTML'}
+            return "sendPhoto", params, references
+
+        media = [
+            {"type": "photo", "media": reference, "caption": caption, "parse_mode": "HTML"}
+            for reference, (_, _, caption) in zip(references, job["photos"])
+        ]
+        return "sendMediaGroup", {'chat_id': job["chat_id"], 'media': json.dumps(media)}, references
+
+    def depth(self):
+        """Number of jobs waiting to be delivered"""
+        with self._cond:
+            return len(self._jobs)
+
+    def get_stats(self):
+        """Return delivery counters with p50/p99 enqueue-to-delivered latency in seconds"""
+        with self._cond:
+            stats = dict(self.stats)
+            latencies = sorted(self._latencies)
+            stats["queue_depth"] = len(self._jobs)
+        if latencies:
+            stats["latency_p50"] = latencies[len(latencies) // 2]
+            stats["latency_p99"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        else:
+            stats["latency_p50"] = stats["latency_p99"] = 0.0
+        return stats
+
+    def _push(self, ready_at, job):
+        with self._cond:
+            heapq.heappush(self._jobs, (ready_at, next(self._seq), job))
+            self._cond.notify()
+
+    def _take(self):
+        """Block until a job is ready and its chat may receive, then reserve a global send slot"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if not self._jobs:
+                    self._cond.wait()
+                    continue
+
+                ready_at, _, job = self._jobs[0]
+                if ready_at > now:
+                    self._cond.wait(ready_at - now)
+                    continue
+
+                heapq.heappop(self._jobs)
+                chat_ready_at = self._chat_ready_at.get(job["chat_id"], 0.0)
+                if chat_ready_at > now:
+                    # Chat is still cooling down: retry the job once it may send again
+                    heapq.heappush(self._jobs, (chat_ready_at, next(self._seq), job))
+                    continue
+
+                slot = max(now, self._next_global_slot)
+                self._next_global_slot = slot + 1.0 / TELEGRAM_GLOBAL_RATE
+                self._chat_ready_at[job["chat_id"]] = slot + TELEGRAM_CHAT_INTERVAL
+                return job, slot
+
+    def _finish(self, job, ok):
+        for signal in job["signals"]:
+            if job["on_done"]:
+                try:
+                    job["on_done"](signal, ok)
+                except Exception as e:
+                    report("send_callback_error", f"\nError in send callback: {str(e)}", "RED", logging.ERROR, error=e)
+
+    def _fail(self, job, error_code, description):
+        with self._cond:
+            self.stats["failed"] += len(job["signals"])
+        METRICS.inc("growbot_signals_failed_total", len(job["signals"]))
+        report(
+            "send_failed",
+            f"\nError sending signal to Telegram: {description}",
+            "RED",
+            logging.ERROR,
+            chat=job["chat_id"],
+            code=error_code,
+            error=description
+        )
+        self._finish(job, False)
+
+    def _worker(self):
+        while True:
+            job, slot = self._take()
+            delay = slot - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            if datetime.now() >= job["expires_at"]:
+                # The signal has executed while the job waited: an alert now would only mislead
+                with self._cond:
+                    self.stats["stale"] += len(job["signals"])
+                self._fail(job, "stale", "signal already executed")
+                continue
+
+            method, params, references = self._request_for(job)
+            image_urls = [image_url for _, image_url, _ in job["photos"]]
+            try:
+                result = telegram_request(job["bot_token"], method, params)
+            except requests.RequestException as e:
+                result = {"ok": False, "error_code": 0, "description": str(e)}
+
+            if result.get("ok"):
+                remember_photo_ids(job["bot_token"], image_urls, result)
+                latency = time.monotonic() - job["enqueued_at"]
+                with self._cond:
+                    self.stats["sent"] += len(job["signals"])
+                    self._latencies.append(latency)
+                METRICS.observe("growbot_send_seconds", latency)
+                METRICS.inc("growbot_signals_sent_total", len(job["signals"]))
+                delivered_at = datetime.now()
+                for signal in job["signals"]:
+                    skew = (delivered_at - _signal_exec_at(signal, delivered_at)).total_seconds() + float(job["send_before"]) * 60
+                    METRICS.observe("growbot_send_skew_seconds", skew)
+                self._finish(job, True)
+                continue
+
+            error_code = result.get("error_code", 0)
+            METRICS.inc("growbot_telegram_errors_total", code=error_code)
+            job["attempts"] += 1
+            if error_code == 400 and references != image_urls and _is_file_id_error(result):
+                # A cached file_id was rejected: forget it and resend by URL
+                forget_photo_ids(image_urls, job["bot_token"])
+                job["use_file_ids"] = False
+                self._push(time.monotonic(), job)
+            elif error_code == 429 and job["attempts"] < TELEGRAM_MAX_ATTEMPTS:
+                # Rate limited: block the chat for retry_after seconds and try again
+                retry_after = result.get("parameters", {}).get("retry_after", 1)
+                ready_at = time.monotonic() + retry_after
+                with self._cond:
+                    self.stats["rate_limited"] += 1
+                    self._chat_ready_at[job["chat_id"]] = max(self._chat_ready_at.get(job["chat_id"], 0.0), ready_at)
+                self._push(ready_at, job)
+            elif (error_code == 0 or error_code >= 500) and job["attempts"] < TELEGRAM_MAX_ATTEMPTS:
+                with self._cond:
+                    self.stats["retries"] += 1
+                self._push(time.monotonic() + 2 ** job["attempts"], job)
             else:
-                print(Fore.RED + f"\nError sending message to Telegram: {response.text}" + Style.RESET_ALL)
-                return False
-                
+                self._fail(job, error_code, result.get("description", result))
+
+_send_queue = None
+_send_queue_lock = threading.Lock()
+
+def get_send_queue():
+    """Return the shared Telegram send queue, starting its workers on first use"""
+    global _send_queue
+    with _send_queue_lock:
+        if _send_queue is None:
+            _send_queue = TelegramSendQueue()
+    return _send_queue
+
+class SignalArchive:
+    """Append-only signal archive, one JSON Lines file per execution date
+
+    Files are DIR/YYYY-MM-DD.jsonl (.jsonl.gz when compressed, appended as
+    gzip members) next to a DIR/YYYY-MM-DD.pairs index listing the pairs the
+    day contains, so a range query opens only the days in range and skips
+    days without the requested pairs. Each line is
+    {"t": "HH:MM", "p": pair, "a": action, "z": timezone, "m": min percentage, "f": fetched at}.
+    Records are buffered and written in batches; signals this process already
+    archived are skipped.
+    """
+
+    def __init__(self, directory, compress=False):
+        self.directory = directory
+        self.compress = compress
+        self._lock = threading.Lock()
+        self._buffer = {}        # day -> [json line]
+        self._buffer_pairs = {}  # day -> pairs in the buffered lines
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._seen = {}          # day -> {(signal key, timezone)} already archived
+        self._indexed = {}       # day -> pairs listed in the day's index file
+
+    def _path(self, day, suffix):
+        return os.path.join(self.directory, day + suffix)
+
+    def add(self, signals, timezone_choice, fetched_at=None):
+        """Buffer signals for archiving, writing the buffer once it is full or old enough"""
+        fetched_at = int(fetched_at or time.time())
+        with self._lock:
+            for signal in signals:
+                if signal.date is None:
+                    continue
+                day = signal.date.isoformat()
+                seen = self._seen.setdefault(day, set())
+                key = (signal.key, timezone_choice)
+                if key in seen:
+                    continue
+                seen.add(key)
+                self._buffer.setdefault(day, []).append(json.dumps({
+                    "t": signal.time,
+                    "p": signal.pair,
+                    "a": signal.action,
+                    "z": timezone_choice,
+                    "m": signal.percentage,
+                    "f": fetched_at
+                }, ensure_ascii=False, separators=(",", ":")))
+                self._buffer_pairs.setdefault(day, set()).add(signal.pair)
+                self._buffered += 1
+            if (self._buffered >= SIGNAL_ARCHIVE_BUFFER
+                    or time.monotonic() - self._last_flush >= SIGNAL_ARCHIVE_FLUSH_INTERVAL):
+                self._flush()
+
+    def flush(self):
+        """Write all buffered records"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        """Append the buffer to the day files (call with _lock held)"""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        buffer, buffer_pairs = self._buffer, self._buffer_pairs
+        self._buffer, self._buffer_pairs, self._buffered = {}, {}, 0
+        error = None
+        for day, lines in buffer.items():
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                data = "\n".join(lines) + "\n"
+                if self.compress:
+                    with gzip.open(self._path(day, ".jsonl.gz"), "at", encoding="utf-8") as f:
+                        f.write(data)
+                else:
+                    with open(self._path(day, ".jsonl"), "a", encoding="utf-8") as f:
+                        f.write(data)
+
+                new_pairs = buffer_pairs[day] - self._day_pairs(day)
+                if new_pairs:
+                    with open(self._path(day, ".pairs"), "a", encoding="utf-8") as f:
+                        f.write("".join(f"{pair}\n" for pair in sorted(new_pairs)))
+                    self._indexed[day] |= new_pairs
+            except OSError as e:
+                # Keep the day buffered for the next flush; a partly written day is
+                # rewritten whole, and query() drops the duplicate lines
+                error = e
+                self._buffer[day] = lines
+                self._buffer_pairs[day] = buffer_pairs[day]
+                self._buffered += len(lines)
+        if error is not None:
+            report("archive_error", f"Error writing signal archive: {error}", "RED", logging.ERROR, error=error)
+
+        # Only recent days can still receive signals; forget the rest
+        for cache in (self._seen, self._indexed):
+            for day in sorted(cache)[:-SIGNAL_ARCHIVE_OPEN_DAYS]:
+                del cache[day]
+
+    def _day_pairs(self, day):
+        """Pairs listed in a day's index file (None if the day has no index)"""
+        pairs = self._indexed.get(day)
+        if pairs is None:
+            try:
+                with open(self._path(day, ".pairs"), encoding="utf-8") as f:
+                    pairs = set(f.read().split())
+            except FileNotFoundError:
+                pairs = set()
+            self._indexed[day] = pairs
+        return pairs
+
+    def query(self, start_date, end_date=None, pairs=None):
+        """Yield archived signals executing from start_date to end_date (inclusive)
+
+        Each record is {"date", "time", "pair", "action", "timezone",
+        "percentage", "fetched_at"}, ordered by date and then time.
+        """
+        self.flush()
+        end_date = end_date or start_date
+        pairs = set(pairs) if pairs else None
+        day = start_date
+        while day <= end_date:
+            name = day.isoformat()
+            day += timedelta(days=1)
+            if pairs is not None:
+                with self._lock:
+                    if not pairs & self._day_pairs(name):
+                        continue
+
+            seen = set()
+            records = []
+            for suffix in (".jsonl", ".jsonl.gz"):
+                path = self._path(name, suffix)
+                if not os.path.exists(path):
+                    continue
+                if suffix == ".jsonl.gz":
+                    f = gzip.open(path, "rt", encoding="utf-8")
+                else:
+                    f = open(path, encoding="utf-8")
+                with f:
+                    for line in f:
+                        record = json.loads(line)
+                        if pairs is not None and record["p"] not in pairs:
+                            continue
+                        # Earlier runs may have archived the same signal again
+                        key = (record["t"], record["p"], record["a"], record["z"])
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        records.append(record)
+
+            records.sort(key=lambda record: record["t"])
+            for record in records:
+                yield {
+                    "date": name,
+                    "time": record["t"],
+                    "pair": record["p"],
+                    "action": record["a"],
+                    "timezone": record["z"],
+                    "percentage": record["m"],
+                    "fetched_at": record["f"]
+                }
+
+_signal_archive = None
+_signal_archive_lock = threading.Lock()
+
+def get_signal_archive():
+    """Return the shared signal archive, flushing it at interpreter exit"""
+    global _signal_archive
+    with _signal_archive_lock:
+        if _signal_archive is None:
+            _signal_archive = SignalArchive(SIGNAL_ARCHIVE_DIR, SIGNAL_ARCHIVE_COMPRESS)
+            atexit.register(_signal_archive.flush)
+    return _signal_archive
+
+def archive_signals(signals, timezone_choice):
+    """Add fetched signals to the signal archive"""
+    get_signal_archive().add(signals, timezone_choice)
+
+def query_signal_archive(start_date, end_date=None, pairs=None):
+    """Archived signals executing from start_date to end_date, optionally limited to pairs"""
+    return list(get_signal_archive().query(start_date, end_date, pairs))
+
+# Every fetched and sent signal, indexed by execution date and pair for backtesting queries
+_signal_history_db = None
+_signal_history_lock = threading.Lock()
+
+def _open_signal_history():
+    """Open the signal history store on first use (call with _signal_history_lock held)"""
+    global _signal_history_db
+    if _signal_history_db is None:
+        db = sqlite3.connect(SIGNAL_HISTORY_FILE, timeout=10, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("""CREATE TABLE IF NOT EXISTS signals (
+            id INTEGER PRIMARY KEY,
+            day TEXT NOT NULL,
+            minute INTEGER NOT NULL,
+            pair TEXT NOT NULL,
+            action TEXT NOT NULL,
+            timezone TEXT NOT NULL,
+            mode TEXT NOT NULL,
+            filter TEXT NOT NULL,
+            min_percentage TEXT,
+            fetched_at REAL NOT NULL,
+            UNIQUE (day, pair, minute, action, timezone, mode, filter)
+        )""")
+        db.execute("CREATE INDEX IF NOT EXISTS signals_pair_day ON signals (pair, day, action)")
+        db.execute("""CREATE TABLE IF NOT EXISTS sends (
+            signal_id INTEGER NOT NULL REFERENCES signals (id),
+            profile TEXT NOT NULL,
+            sent_at REAL NOT NULL
+        )""")
+        db.execute("CREATE INDEX IF NOT EXISTS sends_signal ON sends (signal_id)")
+        _signal_history_db = db
+    return _signal_history_db
+
+def _history_row(signal, query):
+    """Unique key columns of a signal fetched by a query"""
+    return (signal.date.isoformat(), signal.pair, signal.minute, signal.action, query.timezone, query.mode.lower(), query.filter)
+
+def record_fetched_signals(signals, query):
+    """Archive fetched signals and add the ones not seen before to the history store"""
+    archive_signals(signals, query.timezone)
+
+    now = time.time()
+    rows = [_history_row(signal, query) + (query.min_percentage, now) for signal in signals if signal.date is not None]
+    with _signal_history_lock:
+        try:
+            db = _open_signal_history()
+            with db:
+                db.executemany(
+                    "INSERT OR IGNORE INTO signals (day, pair, minute, action, timezone, mode, filter, min_percentage, fetched_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        except (sqlite3.Error, OSError) as e:
+            report("signal_history_error", f"\nError saving signal history: {str(e)}", "RED", logging.ERROR, error=e)
+
+def record_sent_signal(signal, query, profile_name):
+    """Record that a profile delivered a signal to Telegram"""
+    if signal.date is None or signal.action_code == ACTION_NONE:
+        return
+    row = _history_row(signal, query)
+    with _signal_history_lock:
+        try:
+            db = _open_signal_history()
+            with db:
+                db.execute(
+                    "INSERT OR IGNORE INTO signals (day, pair, minute, action, timezone, mode, filter, min_percentage, fetched_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row + (query.min_percentage, time.time())
+                )
+                db.execute(
+                    "INSERT INTO sends (signal_id, profile, sent_at) SELECT id, ?, ? FROM signals"
+                    " WHERE day = ? AND pair = ? AND minute = ? AND action = ? AND timezone = ? AND mode = ? AND filter = ?",
+                    (profile_name, time.time()) + row
+                )
+        except (sqlite3.Error, OSError) as e:
+            report("signal_history_error", f"\nError saving signal history: {str(e)}", "RED", logging.ERROR, error=e)
+
+def _history_filter(start_date, end_date, pair, action, sent_only):
+    """WHERE clause and parameters shared by the history queries"""
+    clauses = ["day BETWEEN ? AND ?"]
+    params = [start_date.isoformat(), (end_date or start_date).isoformat()]
+    if pair:
+        clauses.append("pair = ?")
+        params.append(pair)
+    if action:
+        clauses.append("action = ?")
+        params.append(action.upper())
+    if sent_only:
+        clauses.append("EXISTS (SELECT 1 FROM sends WHERE sends.signal_id = signals.id)")
+    return " AND ".join(clauses), params
+
+def query_signal_history(start_date, end_date=None, pair=None, action=None, sent_only=False):
+    """Signals executing from start_date to end_date (inclusive), oldest first
+
+    Each row is {"date", "time", "pair", "action", "timezone", "mode",
+    "filter", "min_percentage", "fetched_at", "sent_at"}; sent_at is the
+    first delivery time or None.
+    """
+    where, params = _history_filter(start_date, end_date, pair, action, sent_only)
+    with _signal_history_lock:
+        try:
+            rows = _open_signal_history().execute(
+                "SELECT day, minute, pair, action, timezone, mode, filter, min_percentage, fetched_at,"
+                " (SELECT MIN(sent_at) FROM sends WHERE sends.signal_id = signals.id)"
+                f" FROM signals WHERE {where} ORDER BY day, minute, pair",
+                params
+            ).fetchall()
+        except (sqlite3.Error, OSError) as e:
+            report("signal_history_error", f"\nError reading signal history: {str(e)}", "RED", logging.ERROR, error=e)
+            return []
+    return [
+        {
+            "date": day,
+            "time": MINUTE_LABELS[minute],
+            "pair": pair,
+            "action": action,
+            "timezone": timezone_choice,
+            "mode": mode,
+            "filter": filter_value,
+            "min_percentage": min_percentage,
+            "fetched_at": fetched_at,
+            "sent_at": sent_at
+        }
+        for day, minute, pair, action, timezone_choice, mode, filter_value, min_percentage, fetched_at, sent_at in rows
+    ]
+
+def count_signal_history(start_date, end_date=None, pair=None, action=None, sent_only=False):
+    """Number of signals per (pair, action) executing from start_date to end_date (inclusive)"""
+    where, params = _history_filter(start_date, end_date, pair, action, sent_only)
+    with _signal_history_lock:
+        try:
+            rows = _open_signal_history().execute(
+                f"SELECT pair, action, COUNT(*) FROM signals WHERE {where} GROUP BY pair, action ORDER BY pair, action",
+                params
+            ).fetchall()
+        except (sqlite3.Error, OSError) as e:
+            report("signal_history_error", f"\nError reading signal history: {str(e)}", "RED", logging.ERROR, error=e)
+            return {}
+    return {(pair, action): count for pair, action, count in rows}
+
+# Backtesting
+# Signals are scored against 1-minute candles: a CALL wins when its candle
+# closes above the open, a PUT when it closes below. A losing (or flat)
+# candle moves on to the next minute's candle for each martingale step.
+# Candles and signals are keyed by pair code and UTC minute since the epoch,
+# so matching a batch of signals to its candles is a single searchsorted.
+OUTCOME_UNKNOWN = -1  # No action, or a candle needed to decide the outcome is missing
+OUTCOME_LOSS = 0      # Lost every step; a win at step k is stored as k + 1
+
+_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+def _require_numpy():
+    """Return NumPy, or raise ImportError with install instructions if it is missing or broken"""
+    try:
+        np.ndarray  # Performs the lazy import
+    except (AttributeError, ImportError):
+        raise ImportError("Backtesting needs NumPy, which is not installed: pip install numpy") from None
+    return np
+
+def _utc_offset(timezone_choice):
+    """Minutes a timezone choice is ahead of UTC"""
+    return get_timezone_info(timezone_choice)["offset"] + BD_UTC_OFFSET
+
+def _epoch_minutes(values):
+    """UTC minutes since the epoch for a column of epoch seconds/milliseconds or date-time text"""
+    np = _require_numpy()
+    values = np.asarray(values)
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[m]").astype(np.int64)
+    if values.dtype.kind in "OUS":
+        try:
+            values = values.astype(np.float64)
+        except ValueError:
+            # ISO text such as "2025-01-16 09:30" or "2025-01-16T09:30:00"
+            return np.array([str(value).rstrip("Z") for value in values], dtype="datetime64[m]").astype(np.int64)
+    values = values.astype(np.float64)
+    if len(values) and values.max() > 1e11:
+        values = values / 1000  # Milliseconds
+    return (values // 60).astype(np.int64)
+
+_CANDLE_COLUMNS = ("time", "timestamp", "datetime", "date", "open", "close", "pair", "symbol", "asset")
+
+def _read_candle_csv(path):
+    """Columns of a candle CSV file as arrays, parsed by NumPy's C reader
+
+    Numeric columns are read together in one pass, text columns (pair, ISO
+    times) in another.
+    """
+    np = _require_numpy()
+    import csv
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [name.strip().lower() for name in next(reader, [])]
+        first = next(reader, None)
+    if first is None:
+        return {name: np.empty(0) for name in header}
+
+    numeric, text = [], []
+    for i, name in enumerate(header):
+        if name in _CANDLE_COLUMNS:
+            try:
+                float(first[i])
+                numeric.append(i)
+            except ValueError:
+                text.append(i)
+
+    columns = {}
+    options = dict(delimiter=",", skiprows=1, quotechar='"', ndmin=2, encoding="utf-8")
+    if numeric:
+        values = np.loadtxt(path, usecols=numeric, dtype=np.float64, **options)
+        columns.update((header[i], values[:, n]) for n, i in enumerate(numeric))
+    if text:
+        values = np.loadtxt(path, usecols=text, dtype=str, **options)
+        columns.update((header[i], values[:, n]) for n, i in enumerate(text))
+    return columns
+
+def load_candles(paths, pair=None):
+    """Load 1-minute OHLC candles from CSV or Parquet files
+
+    Each file needs a time column (time/timestamp/datetime/date; UTC epoch
+    seconds, milliseconds or ISO text) plus open and close. Without a
+    pair/symbol/asset column every row belongs to `pair`, or to the file
+    name (EURUSD_otc.csv). Returns {"keys", "open", "close"} arrays sorted
+    by key.
+    """
+    np = _require_numpy()
+    if isinstance(paths, str):
+        paths = [paths]
+
+    keys, opens, closes = [], [], []
+    for path in paths:
+        if path.lower().endswith(".parquet"):
+            try:
+                import pyarrow.parquet as parquet
+            except ImportError:
+                raise ImportError("Reading Parquet candles needs pyarrow: pip install pyarrow") from None
+            table = parquet.read_table(path)
+            columns = {name.lower(): table.column(name).to_numpy() for name in table.column_names}
+        else:
+            columns = _read_candle_csv(path)
+
+        time_column = next((name for name in ("time", "timestamp", "datetime", "date") if name in columns), None)
+        if time_column is None or "open" not in columns or "close" not in columns:
+            raise ValueError(f"{path}: candle files need time, open and close columns")
+
+        pair_column = next((name for name in ("pair", "symbol", "asset") if name in columns), None)
+        if pair_column is not None:
+            names, inverse = np.unique(columns[pair_column].astype(str), return_inverse=True)
+            codes = np.array([intern_pair(name) for name in names], dtype=np.int64)[inverse]
+        else:
+            name = pair or os.path.splitext(os.path.basename(path))[0]
+            codes = np.full(len(columns[time_column]), intern_pair(name), dtype=np.int64)
+
+        keys.append(codes << 32 | _epoch_minutes(columns[time_column]))
+        opens.append(columns["open"].astype(np.float64))
+        closes.append(columns["close"].astype(np.float64))
+
+    keys = np.concatenate(keys) if keys else np.empty(0, np.int64)
+    order = np.argsort(keys, kind="stable")
+    return {
+        "keys": keys[order],
+        "open": np.concatenate(opens)[order] if opens else np.empty(0),
+        "close": np.concatenate(closes)[order] if closes else np.empty(0)
+    }
+
+def _signal_arrays(signals, timezone_choice):
+    """(pair codes, candle keys, directions) for Signal objects or archive/history records"""
+    np = _require_numpy()
+    offsets = {}
+
+    def utc_offset(choice):
+        offset = offsets.get(choice)
+        if offset is None:
+            offset = offsets[choice] = _utc_offset(choice)
+        return offset
+
+    if signals and isinstance(signals[0], Signal):
+        offset = utc_offset(timezone_choice)
+        pair_codes = np.fromiter((signal.pair_code for signal in signals), np.int64, len(signals))
+        days = np.fromiter(
+            (signal.date.toordinal() if signal.date is not None else _EPOCH_ORDINAL for signal in signals),
+            np.int64, len(signals)
+        )
+        minutes = np.fromiter((signal.minute for signal in signals), np.int64, len(signals)) - offset
+        actions = np.fromiter((signal.action_code for signal in signals), np.int8, len(signals))
+    else:
+        pair_codes = np.fromiter((intern_pair(record["pair"]) for record in signals), np.int64, len(signals))
+        days = np.array([record["date"] for record in signals], dtype="datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+        minutes = np.fromiter(
+            (int(record["time"][:2]) * 60 + int(record["time"][3:5]) - utc_offset(record.get("timezone", timezone_choice))
+             for record in signals),
+            np.int64, len(signals)
+        )
+        actions = np.fromiter((_action_index.get(record["action"], ACTION_NONE) for record in signals), np.int8, len(signals))
+
+    epoch_minutes = (days - _EPOCH_ORDINAL) * 1440 + minutes
+    directions = np.select([actions == ACTION_CALL, actions == ACTION_PUT], [1, -1], 0).astype(np.int8)
+    return pair_codes, pair_codes << 32 | epoch_minutes, directions
+
+def backtest_signals(signals, candles, timezone_choice="1", martingale_steps=1):
+    """Score signals against candles from load_candles()
+
+    `signals` are Signal objects (times in `timezone_choice`) or archive /
+    history records (each with its own "timezone"). Returns
+    {"outcomes": int8 array per signal, "pairs": {pair: stats}, "total": stats}
+    where stats count signals, wins per step ("wins"), losses, unknown
+    outcomes and the win rate over decided signals.
+    """
+    np = _require_numpy()
+    signals = list(signals)
+    pair_codes, keys, directions = _signal_arrays(signals, timezone_choice)
+    candle_keys = candles["keys"]
+    moves = np.sign(candles["close"] - candles["open"]).astype(np.int8)
+
+    outcomes = np.full(len(signals), OUTCOME_UNKNOWN, np.int8)
+    pending = directions != 0
+    for step in range(martingale_steps + 1):
+        if not len(candle_keys):
+            break
+        wanted = keys + step
+        index = np.minimum(np.searchsorted(candle_keys, wanted), len(candle_keys) - 1)
+        found = candle_keys[index] == wanted
+        won = pending & found & (moves[index] == directions)
+        outcomes[won] = step + 1
+        pending &= found & ~won
+    outcomes[pending] = OUTCOME_LOSS
+
+    def stats(selected):
+        counts = np.bincount(outcomes[selected] + 1, minlength=martingale_steps + 3)
+        wins = counts[2:].tolist()
+        decided = sum(wins) + int(counts[1])
+        return {
+            "signals": int(selected.sum()),
+            "wins": wins,
+            "losses": int(counts[1]),
+            "unknown": int(counts[0]),
+            "win_rate": sum(wins) / decided if decided else None
+        }
+
+    return {
+        "outcomes": outcomes,
+        "pairs": {PAIR_CODES[code]: stats(pair_codes == code) for code in np.unique(pair_codes).tolist()},
+        "total": stats(np.ones(len(signals), dtype=bool))
+    }
+
+def martingale_step_count(settings):
+    """Number of martingale steps from a 'martingale_steps' setting such as "1 Step" """
+    match = re.match(r"\s*(\d+)", str(settings.get("martingale_steps", "1")))
+    return int(match.group(1)) if match else 1
+
+def render_signals_text(signals, api_date, timezone_choice, generated_at=None):
+    """Render signals as the Telegram-like text export"""
+    timezone_info = get_timezone_info(timezone_choice)
+    generated_at = generated_at or datetime.now()
+    unique_pairs = ", ".join(sorted(set(signal.pair for signal in signals)))
+
+    lines = [f"""╔════════✰═══════════╗
+⏱️ TIMEZONE: {timezone_info['display']}
+🇮🇳 @Growupbinarytrading
+  Date: {api_date}
+  Time: {generated_at.strftime("%H-%M-%S")}
+  Pairs: {unique_pairs}
+ ‼️ONLY FOR QUOTEX‼️
+╚════════✰═══════════╝
+
++------------+-------------+-------------+
+| Quotex Pair | Time | Action |
++------------+-------------+-------------+"""]
+
+    for signal in signals:
+        action = signal.action
+        # Add arrow if action is CALL or PUT
+        if action in ["CALL", "PUT"]:
+            action_symbol = "🔼" if action == "CALL" else "🔽"
+            action_text = f"{action_symbol} {action}"
+        else:
+            action_text = action
+        lines.append(f"| {signal.pair:<12} | {signal.time:<11} | {action_text:<6} |")
+
+    lines.append("""+------------+-------------+-------------+
+
+‼️ RULE ‼️ 
+If the previous candle is weak, the signal should be avoided
+Follow Trend
+
+🔗 Join @GrowupBinaryTrading
+📱 Support: @Team_GrowUp""")
+    return "\n".join(lines)
+
+def export_signals_text(signals, api_date, timezone_choice):
+    """Write the text export of signals to the Signals folder"""
+    try:
+        signals_dir = os.path.join(APP_PATH, "Signals")
+        os.makedirs(signals_dir, exist_ok=True)
+
+        generated_at = datetime.now()
+        filename = f"signals_{api_date.replace('/', '-')}_{generated_at.strftime('%H-%M-%S')}.txt"
+        filepath = os.path.join(signals_dir, filename)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(render_signals_text(signals, api_date, timezone_choice, generated_at))
+
+        print(Fore.GREEN + f"\n✅ Signals saved to Signals/{filename} successfully!")
+        print(Fore.CYAN + f"📂 File location: {filepath}" + Style.RESET_ALL)
         return True
-            
     except Exception as e:
-        print(Fore.RED + f"\nError sending signal to Telegram: {str(e)}" + Style.RESET_ALL)
+        print(Fore.RED + f"\n❌ Error saving signals to file: {str(e)}" + Style.RESET_ALL)
         return False
 
-def save_signals_to_file(signals, api_date):
-    """Save signals to a text file with Telegram-like formatting"""
-    try:
-        timezone_choice = DEFAULT_SETTINGS.get("timezone", "1")
-        timezone_info = TIMEZONE_OPTIONS[timezone_choice]
-        
-        # Create Signals directory in the same folder as the executable/script
-        signals_dir = os.path.join(APP_PATH, "Signals")
-        os.makedirs(signals_dir, exist_ok=True)
-        
-        # Get current time for filename
-        current_time = datetime.now().strftime("%H-%M-%S")
-        
-        # Get unique pairs from actual signals
-        unique_pairs = "_".join(sorted(set(signal['pair'] for signal in signals)))
-        filename = f"{unique_pairs}_{api_date.replace('/', '_')}_{current_time}.txt"
-        filepath = os.path.join(signals_dir, filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            # Write header
-            f.write(f"""╔════════✰═══════════╗
-⏱️ TIMEZONE: {timezone_info['display']}
-🇮🇳 @Growupbinarytrading
-  Date: {api_date}
-  Time: {current_time}
-  Pairs: {unique_pairs.replace('_', ', ')}
- ‼️ONLY FOR QUOTEX‼️
-╚════════✰═══════════╝
+# Last response per query, used for conditional requests and to skip re-parsing
+_response_cache = {}
+_response_cache_lock = threading.Lock()
+
+# Queries answered from stored responses while the API is unreachable: cache key -> time.time() of that response
+_replaying = {}
+
+# On-disk copy of the latest response per query and API date, replayed while the API is unreachable
+_signal_cache_db = None
+_signal_cache_lock = threading.Lock()
+
+def _open_signal_cache():
+    """Open the offline signal cache on first use (call with _signal_cache_lock held)"""
+    global _signal_cache_db
+    if _signal_cache_db is None:
+        db = sqlite3.connect(SIGNAL_CACHE_FILE, timeout=10, check_same_thread=False)
+        # WAL lets supervisor workers read while one of them writes; NORMAL sync skips an fsync per commit
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("""CREATE TABLE IF NOT EXISTS responses (
+            query TEXT NOT NULL,
+            api_date TEXT NOT NULL,
+            body TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (query, api_date)
+        )""")
+        db.execute("CREATE INDEX IF NOT EXISTS responses_fetched_at ON responses (fetched_at)")
+        _signal_cache_db = db
+    return _signal_cache_db
+
+def store_cached_response(cache_key, api_date, body):
+    """Persist a raw API response, then evict expired rows and enforce the size cap"""
+    now = time.time()
+    with _signal_cache_lock:
+        try:
+            db = _open_signal_cache()
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (query, api_date, body, fetched_at) VALUES (?, ?, ?, ?)",
+                    (json.dumps(cache_key), api_date, body, now)
+                )
+                db.execute("DELETE FROM responses WHERE fetched_at < ?", (now - SIGNAL_CACHE_TTL,))
+                total = 0
+                for rowid, size in db.execute("SELECT rowid, length(body) FROM responses ORDER BY fetched_at DESC").fetchall():
+                    total += size
+                    if total > SIGNAL_CACHE_MAX_BYTES:
+                        db.execute("DELETE FROM responses WHERE rowid = ?", (rowid,))
+        except (sqlite3.Error, OSError) as e:
+            report("signal_cache_error", f"\nError saving signal cache: {str(e)}", "RED", logging.ERROR, error=e)
+
+def touch_cached_response(cache_key, api_date):
+    """Mark a stored response as just confirmed by the API (for SHARED_FETCH_MAX_AGE)"""
+    with _signal_cache_lock:
+        try:
+            db = _open_signal_cache()
+            with db:
+                db.execute(
+                    "UPDATE responses SET fetched_at = ? WHERE query = ? AND api_date = ?",
+                    (time.time(), json.dumps(cache_key), api_date)
+                )
+        except (sqlite3.Error, OSError) as e:
+            report("signal_cache_error", f"\nError saving signal cache: {str(e)}", "RED", logging.ERROR, error=e)
+
+def load_cached_response(cache_key, max_age=SIGNAL_CACHE_TTL):
+    """Return (body, fetched_at) of the newest API response for a query stored within max_age seconds, or None"""
+    with _signal_cache_lock:
+        try:
+            row = _open_signal_cache().execute(
+                "SELECT body, fetched_at FROM responses WHERE query = ? AND fetched_at >= ? ORDER BY fetched_at DESC LIMIT 1",
+                (json.dumps(cache_key), time.time() - max_age)
+            ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+    return tuple(row) if row else None
+
+def get_replay_age():
+    """Age in seconds of the oldest response replayed in place of the API, or None while every query is live"""
+    with _response_cache_lock:
+        oldest = min(_replaying.values(), default=None)
+    return None if oldest is None else time.time() - oldest
+
+def _body_digest(body):
+    return hashlib.sha1(body.encode("utf-8")).digest()
+
+def _remember_response(cache_key, cached, body, digest, etag=None, last_modified=None, stored_at=None):
+    """Record the latest response body for a query and return its cache entry
+
+    The existing entry (and every result parsed from it) is kept when the
+    body did not change, so unchanged responses map to the very same objects.
+    stored_at is when the API last returned the body (default: now).
+    """
+    with _response_cache_lock:
+        if cached is None or cached["digest"] != digest:
+            cached = {"digest": digest, "body": body, "parsed": {}, "etag": None, "last_modified": None}
+        cached["etag"] = etag or cached["etag"]
+        cached["last_modified"] = last_modified or cached["last_modified"]
+        cached["fetched_at"] = time.monotonic()
+        cached["stored_at"] = stored_at or time.time()
+        _response_cache[cache_key] = cached
+    return cached
+
+def _entry_result(entry, mode, min_percentage, timezone_choice):
+    """Parsed (api_date, signals) of a cache entry for a timezone, parsing on first use"""
+    result = entry["parsed"].get(timezone_choice)
+    if result is None:
+        result = parse_signal_response(entry["body"], mode, min_percentage, timezone_choice)
+        with _response_cache_lock:
+            result = entry["parsed"].setdefault(timezone_choice, result)
+    return result
+
+def _replay_signal_list(cache_key, cached, mode, min_percentage, timezone_choice):
+    """Result of the last good response (within SIGNAL_CACHE_TTL) for a query while the API is unreachable, or None"""
+    if cached and time.time() - cached["stored_at"] <= SIGNAL_CACHE_TTL:
+        entry = cached
+    else:
+        stored = load_cached_response(cache_key, SIGNAL_CACHE_TTL)
+        if stored is None:
+            with _response_cache_lock:
+                _replaying.pop(cache_key, None)  # Nothing left to replay; the fetch fails instead
+            return None
+        body, stored_at = stored
+        entry = _remember_response(cache_key, cached, body, _body_digest(body), stored_at=stored_at)
+
+    with _response_cache_lock:
+        started = cache_key not in _replaying
+        _replaying[cache_key] = entry["stored_at"]
+    METRICS.inc("growbot_fetch_replays_total")
+    if started:
+        age = int(time.time() - entry["stored_at"])
+        report("signals_replayed", f"\nSignal API unreachable: replaying signals fetched {age // 60} min ago.",
+               "YELLOW", logging.WARNING, age=age)
+    return _entry_result(entry, mode, min_percentage, timezone_choice)
+
+def _fetch_signal_list(params, cache_key, cached, timezone_choice):
+    """Request a query from the API (or the shared/offline cache) and update its cache entry"""
+    mode = params["mode"]
+    min_percentage = params["min_percentage"]
+
+    if SHARED_FETCH_MAX_AGE:
+        stored = load_cached_response(cache_key, SHARED_FETCH_MAX_AGE)
+        if stored is not None:
+            body, stored_at = stored
+            entry = _remember_response(cache_key, cached, body, _body_digest(body), stored_at=stored_at)
+            with _response_cache_lock:
+                _replaying.pop(cache_key, None)
+            return _entry_result(entry, mode, min_percentage, timezone_choice)
+
+    headers = {}
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        response = http_get(API_URL, params=params, headers=headers or None)
+        if response.status_code == 304 and cached:
+            body = cached["body"]
+            digest = cached["digest"]
+        else:
+            response.raise_for_status()
+            body = response.text
+            digest = _body_digest(body)
+    except requests.RequestException:
+        replay = _replay_signal_list(cache_key, cached, mode, min_percentage, timezone_choice)
+        if replay is None:
+            raise
+        return replay
+
+    entry = _remember_response(cache_key, cached, body, digest, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    with _response_cache_lock:
+        _replaying.pop(cache_key, None)
+    result = _entry_result(entry, mode, min_percentage, timezone_choice)
+    if result[0] is not None:
+        if entry is not cached:
+            store_cached_response(cache_key, result[0], body)
+        elif SHARED_FETCH_MAX_AGE:
+            touch_cached_response(cache_key, result[0])
+    return result
+
+# Queries currently being fetched: cache key -> {"done": Event, "error": exception or None}
+_inflight = {}
+
+def fetch_signal_list(params, timezone_choice):
+    """Fetch and parse signals for a query, reusing the previous result when nothing changed
+
+    The last response per parameter set is kept with its ETag/Last-Modified
+    headers and a content hash. When the API answers 304 or returns the same
+    body, the previously parsed (api_date, signals) tuple is returned as the
+    very same object, so callers can cheaply detect "no change" by identity.
+
+    Identical queries are single-flight: while one is being fetched, others
+    wait for it and share its response, and a response fetched less than
+    SINGLE_FLIGHT_TTL seconds ago is reused without a request.
+
+    New responses are also written to the on-disk signal cache. If the API
+    cannot be reached, the last stored response for the query (within
+    SIGNAL_CACHE_TTL) is replayed instead of raising.
+
+    With SHARED_FETCH_MAX_AGE set (supervisor workers), a response stored
+    by any process within that many seconds is used without a request, so
+    identical queries from different workers hit the API once.
+    """
+    cache_key = tuple(sorted((key, str(value)) for key, value in params.items()))
+
+    with _response_cache_lock:
+        cached = _response_cache.get(cache_key)
+        fresh = cached is not None and time.monotonic() - cached["fetched_at"] < SINGLE_FLIGHT_TTL
+        flight = None if fresh else _inflight.get(cache_key)
+        leader = not fresh and flight is None
+        if leader:
+            flight = _inflight[cache_key] = {"done": threading.Event(), "error": None}
+
+    if fresh:
+        METRICS.inc("growbot_fetch_dedup_total", reason="ttl")
+        return _entry_result(cached, params["mode"], params["min_percentage"], timezone_choice)
+
+    if not leader:
+        # An identical query is already in flight: wait for it and share its response
+        METRICS.inc("growbot_fetch_dedup_total", reason="inflight")
+        flight["done"].wait()
+        if flight["error"] is not None:
+            raise flight["error"]
+        with _response_cache_lock:
+            entry = _response_cache[cache_key]
+        return _entry_result(entry, params["mode"], params["min_percentage"], timezone_choice)
+
+    try:
+        return _fetch_signal_list(params, cache_key, cached, timezone_choice)
+    except Exception as e:
+        flight["error"] = e
+        raise
+    finally:
+        with _response_cache_lock:
+            del _inflight[cache_key]
+        flight["done"].set()
+
+# Signal response parser
+# A single compiled pattern walks the response once and picks out the
+# "Signals:" marker, the "Date: DD/MM/YYYY" header and every
+# "PA～pair～HH:MM～ACTION" line, so there is no split/strptime per line.
+_SIGNAL_RESPONSE_RE = re.compile(
+    r"(?P<marker>Signals:)"
+    r"|Date: (?P<date>\d{2}/\d{2}/\d{4})"
+    r"|PA～(?P<pair>[^～\r\n]*)～(?P<hour>\d{1,2}):(?P<minute>\d{2})～(?P<action>[^～\r\n]*)"
+)
+
+def parse_signal_records(text):
+    """Parse a raw signal API response into (api_date, records) in one pass
+
+    Each record is a (pair_code, minute_of_day, action_code) tuple of
+    integers, where minute_of_day is the Bangladesh (UTC+6:00) execution
+    time 0-1439. api_date is None when the response does not contain a
+    signal list.
+    """
+    has_signals = False
+    api_date = None
+    records = []
+    append = records.append
+
+    for match in _SIGNAL_RESPONSE_RE.finditer(text):
+        pair, hour, minute, action = match.group("pair", "hour", "minute", "action")
+        if pair is not None:
+            hour = int(hour)
+            minute = int(minute)
+            if hour < 24 and minute < 60:
+                append((intern_pair(pair), hour * 60 + minute, _action_index.get(action.strip().upper(), ACTION_NONE)))
+        elif match.group("marker"):
+            has_signals = True
+        elif api_date is None:
+            api_date = match.group("date")
+
+    if not has_signals:
+        return None, []
+    return api_date or "Unknown Date", records
+
+def parse_signal_response(text, mode, min_percentage, timezone_choice):
+    """Parse a raw signal API response into (api_date, signals)
+
+    api_date is None when the response does not contain a signal list.
+    """
+    started = time.perf_counter()
+    api_date, records = parse_signal_records(text)
+    if api_date is None:
+        METRICS.observe("growbot_parse_seconds", time.perf_counter() - started)
+        return None, []
+
+    local_minutes, _, day_shifts = get_timezone_table(get_timezone_info(timezone_choice)["offset"])
+    is_blackout = "blackout" in mode.lower()
+
+    # Execution date of each signal: the API date plus the timezone day rollover
+    try:
+        base_date = datetime.strptime(api_date, "%d/%m/%Y").date()
+        dates = {shift: base_date + timedelta(days=shift) for shift in (-1, 0, 1)}
+    except ValueError:
+        dates = {}
+
+    # Convert to selected timezone
+    signals = [
+        Signal(
+            pair_code,
+            local_minutes[minute_of_day],
+            ACTION_NONE if is_blackout else action_code,
+            dates.get(day_shifts[minute_of_day]),
+            min_percentage
+        )
+        for pair_code, minute_of_day, action_code in records
+    ]
+
+    METRICS.observe("growbot_parse_seconds", time.perf_counter() - started)
+    return api_date, signals
+
+# Last merge per sharded query, so an unchanged merge is returned as the same object
+_merged_results = {}
+_shard_cache_lock = threading.Lock()
+
+def _setting_int(settings, key, default):
+    """Read a positive integer setting stored as text, falling back to default"""
+    try:
+        value = int(settings.get(key, default))
+        return value if value > 0 else default
+    except (TypeError, ValueError):
+        return default
+
+def fetch_signal_list_sharded(params, timezone_choice, shard_size=FETCH_SHARD_SIZE, concurrency=FETCH_CONCURRENCY):
+    """Fetch a multi-pair query as parallel per-shard requests and merge the results
+
+    The comma-separated pairs are split into shards of `shard_size` and
+    fetched on up to `concurrency` threads. The merged signals are sorted by
+    execution date and time. A failing shard is replayed by
+    fetch_signal_list() from its last stored response (within
+    SIGNAL_CACHE_TTL). If there is none the whole fetch raises, because a
+    merge without its pairs would un-schedule them. As with
+    fetch_signal_list(), an unchanged result is returned as the same object.
+    """
+    pairs = [pair.strip() for pair in str(params["pairs"]).split(",") if pair.strip()]
+    if len(pairs) <= shard_size:
+        return fetch_signal_list(params, timezone_choice)
+
+    shard_params = [
+        dict(params, pairs=",".join(pairs[i:i + shard_size]))
+        for i in range(0, len(pairs), shard_size)
+    ]
+    shard_keys = [(tuple(sorted((key, str(value)) for key, value in shard.items())), timezone_choice) for shard in shard_params]
+
+    def fetch_shard(shard):
+        try:
+            return fetch_signal_list(shard, timezone_choice), None
+        except requests.RequestException as e:
+            return None, e
 
-+------------+-------------+-------------+
-| Quotex Pair | Time | Action |
-+------------+-------------+-------------+""")
+    from concurrent.futures import ThreadPoolExecutor
 
-            # Write signals
-            for signal in signals:
-                pair = signal['pair']
-                time = signal['time']
-                action = signal['action']
-                
-                # Add arrow if action is CALL or PUT
-                if action in ["CALL", "PUT"]:
-                    action_symbol = "🔼" if action == "CALL" else "🔽"
-                    action_text = f"{action_symbol} {action}"
-                else:
-                    action_text = action
-                
-                f.write(f"\n| {pair:<12} | {time:<11} | {action_text:<6} |")
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(shard_params))) as executor:
+        outcomes = list(executor.map(fetch_shard, shard_params))
 
-            # Write footer
-            f.write("""
-+------------+-------------+-------------+
+    for result, error in outcomes:
+        if result is None:
+            raise error
+    results = [result for result, _ in outcomes]
 
-‼️ RULE ‼️ 
-If the previous candle is weak, the signal should be avoided
-Follow Trend
+    merged_key = (tuple(shard_keys), timezone_choice)
+    with _shard_cache_lock:
+        previous = _merged_results.get(merged_key)
+    if previous and len(previous[0]) == len(results) and all(a is b for a, b in zip(previous[0], results)):
+        return previous[1]
 
-🔗 Join @GrowupBinaryTrading
-📱 Support: @Team_GrowUp""")
-            
-        print(Fore.GREEN + f"\n✅ Signals saved to Signals/{filename} successfully!")
-        print(Fore.CYAN + f"📂 File location: {filepath}" + Style.RESET_ALL)
-        return True
-    except Exception as e:
-        print(Fore.RED + f"\n❌ Error saving signals to file: {str(e)}" + Style.RESET_ALL)
-        return False
+    api_date = next((date for date, _ in results if date is not None), None)
+    signals = [signal for _, shard_signals in results for signal in shard_signals]
+    signals.sort(key=lambda signal: (signal.date.toordinal() if signal.date else 0, signal.minute))
+    merged = (api_date, signals)
 
-def fetch_signals_with_settings(auto_settings, silent_mode=True):
-    """Fetch signals using the provided settings"""
-    global DEFAULT_SETTINGS
-    original_settings = DEFAULT_SETTINGS.copy()
-    
+    with _shard_cache_lock:
+        _merged_results[merged_key] = (results, merged)
+    return merged
+
+class SignalQuery(collections.namedtuple(
+    "SignalQuery",
+    "pairs start_time end_time days mode min_percentage filter separate timezone"
+)):
+    """Immutable description of one signal API query
+
+    Queries are plain values, so any number of them can be fetched from
+    threads or tasks at the same time without touching global settings.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_default_settings(cls, settings):
+        """Build a query from default_settings.json style settings"""
+        return cls(
+            pairs=str(settings["pairs"]),
+            start_time=str(settings["start_time"]),
+            end_time=str(settings["end_time"]),
+            days=str(settings["days"]),
+            mode=str(settings["mode"]),
+            min_percentage=str(settings["min_percentage"]),
+            filter=str(settings["filter_value"]),
+            separate=str(settings["separate"]),
+            timezone=str(settings.get("timezone", "1"))
+        )
+
+    @classmethod
+    def from_auto_settings(cls, settings):
+        """Build a query from auto_bot_settings.json style settings or a bot profile"""
+        return cls(
+            pairs=str(settings["pairs"]),
+            start_time=str(settings["start_time"]),
+            end_time=str(settings["end_time"]),
+            days=str(settings["days"]),
+            mode=str(settings["mode"]),
+            min_percentage=str(settings["min_percentage"]),
+            filter=str(settings["filter"]),
+            separate=str(settings["separate_trend"]),
+            timezone=str(settings.get("timezone", "1"))
+        )
+
+    def params(self):
+        """Signal API query parameters"""
+        return {
+            "pairs": self.pairs,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "days": self.days,
+            "mode": self.mode,
+            "min_percentage": self.min_percentage,
+            "filter": self.filter,
+            "separate": self.separate
+        }
+
+class AutoBotConfig(collections.namedtuple(
+    "AutoBotConfig",
+    "query send_before trading_start trading_end shard_size concurrency timezone"
+)):
+    """Typed, immutable form of auto bot settings or a bot profile
+
+    Settings are stored as the strings the menus edit and save; this is
+    what the fetch and schedule paths read, parsed once per snapshot.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """Parse auto_bot_settings.json style settings; raises ValueError on bad values"""
+        return cls(
+            query=SignalQuery.from_auto_settings(settings),
+            send_before=float(settings.get('send_before', '1')),  # Minutes before execution
+            trading_start=datetime.strptime(settings['start_time'], "%H:%M").time(),
+            trading_end=datetime.strptime(settings['end_time'], "%H:%M").time(),
+            shard_size=_setting_int(settings, "fetch_shard_size", FETCH_SHARD_SIZE),
+            concurrency=_setting_int(settings, "fetch_concurrency", FETCH_CONCURRENCY),
+            timezone=str(settings.get('timezone', '1'))
+        )
+
+_auto_bot_configs = {}
+_auto_bot_configs_lock = threading.Lock()
+
+def get_auto_bot_config(settings):
+    """AutoBotConfig for settings, cached per FrozenSettings object (other mappings are parsed every call)"""
+    if not isinstance(settings, FrozenSettings):
+        return AutoBotConfig.from_settings(settings)
+    config = _auto_bot_configs.get(settings)
+    if config is None:
+        config = AutoBotConfig.from_settings(settings)
+        with _auto_bot_configs_lock:
+            if len(_auto_bot_configs) >= AUTO_BOT_CONFIG_CACHE_SIZE:
+                _auto_bot_configs.clear()
+            _auto_bot_configs[settings] = config
+    return config
+
+def fetch_query(query, shard_size=FETCH_SHARD_SIZE, concurrency=FETCH_CONCURRENCY):
+    """Fetch and parse a SignalQuery, returning (api_date, signals)
+
+    Re-entrant: raises requests exceptions instead of printing them.
+    """
+    started = time.perf_counter()
     try:
-        # Override settings temporarily
-        temp_settings = original_settings.copy()
-        temp_settings.update({
-            'pairs': auto_settings['pairs'],
-            'mode': auto_settings['mode'],
-            'min_percentage': auto_settings['min_percentage'],
-            'filter': auto_settings['filter'],
-            'separate_trend': auto_settings['separate_trend'],
-            'timezone': auto_settings['timezone']
-        })
-        DEFAULT_SETTINGS = temp_settings
-        
-        return fetch_signals(return_signals=True, silent_mode=silent_mode)
-    finally:
-        # Always restore original settings
-        DEFAULT_SETTINGS = original_settings
+        api_date, signals = fetch_signal_list_sharded(query.params(), query.timezone, shard_size, concurrency)
+    except requests.RequestException:
+        METRICS.inc("growbot_fetch_errors_total")
+        raise
+    METRICS.observe("growbot_fetch_seconds", time.perf_counter() - started)
+    METRICS.observe("growbot_signals_per_fetch", len(signals))
+    return api_date, signals
+
+def fetch_profile_signals(profile):
+    """Fetch signals for an auto bot profile without touching global settings"""
+    config = get_auto_bot_config(profile)
+    _, signals = fetch_query(config.query, config.shard_size, config.concurrency)
+    return signals
 
 def fetch_signals(return_signals=False, silent_mode=False):
     """Fetch signals from API"""
@@ -697,7 +2647,8 @@ def fetch_signals(return_signals=False, silent_mode=False):
         print(Fore.YELLOW + f"Min Percentage: {DEFAULT_SETTINGS['min_percentage']}")
         print(Fore.YELLOW + f"Filter Value: {DEFAULT_SETTINGS['filter_value']}")
         print(Fore.YELLOW + f"Separate: {DEFAULT_SETTINGS['separate']}")
-        print(Fore.YELLOW + f"Timezone: {TIMEZONE_OPTIONS[DEFAULT_SETTINGS['timezone']]['name']} ({TIMEZONE_OPTIONS[DEFAULT_SETTINGS['timezone']]['display']})\n")
+        timezone_info = get_timezone_info(DEFAULT_SETTINGS['timezone'])
+        print(Fore.YELLOW + f"Timezone: {timezone_info['name']} ({timezone_info['display']})\n")
 
         use_default = input(Fore.YELLOW + "Use default settings? (y/n):\nEnter choice: " + Style.RESET_ALL).strip().lower()
         
@@ -726,8 +2677,7 @@ def fetch_signals(return_signals=False, silent_mode=False):
                     "filter_value": params["filter"],
                     "separate": params["separate"]
                 })
-                with open(DEFAULT_SETTINGS_FILE, 'w') as f:
-                    json.dump(DEFAULT_SETTINGS, f, indent=4)
+                DEFAULT_SETTINGS_STORE.save(DEFAULT_SETTINGS)
                 print(Fore.GREEN + "\nSettings saved as new defaults!" + Style.RESET_ALL)
 
     if not silent_mode:
@@ -738,53 +2688,26 @@ def fetch_signals(return_signals=False, silent_mode=False):
             print(Fore.RED + "\nError: No internet connection. Please check your network and try again." + Style.RESET_ALL)
         return None
 
+    query = SignalQuery(timezone=str(DEFAULT_SETTINGS.get("timezone", "1")), **params)
+
     try:
-        response = requests.get(API_URL, params=params)
-        response.raise_for_status()
-
-        if "Signals:" in response.text:
-            signal_lines = response.text.split("\n")
-            signals = []
-
-            # Extract the date from the raw response
-            date_match = re.search(r"Date: (\d{2}/\d{2}/\d{4})", response.text)
-            api_date = date_match.group(1) if date_match else "Unknown Date"
-
-            # Process each line to extract signals
-            for line in signal_lines:
-                if "PA～" in line:
-                    parts = line.strip().split("～")
-                    if len(parts) >= 4:  # Make sure we have all parts
-                        pair = parts[1]
-                        time_utc = parts[2]
-                        signal_type = parts[3]
-                        
-                        # Convert to selected timezone
-                        time_ist = convert_to_indian_time(time_utc)
-
-                        if "blackout" in DEFAULT_SETTINGS["mode"].lower():
-                            signals.append({
-                                "pair": pair,
-                                "time": time_ist,
-                                "action": "N/A",
-                                "percentage": DEFAULT_SETTINGS["min_percentage"]
-                            })
-                        else:
-                            action = signal_type.upper() if signal_type else "N/A"
-                            signals.append({
-                                "pair": pair,
-                                "time": time_ist,
-                                "action": action,
-                                "percentage": DEFAULT_SETTINGS["min_percentage"]
-                            })
+        api_date, signals = fetch_query(
+            query,
+            _setting_int(DEFAULT_SETTINGS, "fetch_shard_size", FETCH_SHARD_SIZE),
+            _setting_int(DEFAULT_SETTINGS, "fetch_concurrency", FETCH_CONCURRENCY)
+        )
 
+        if api_date is not None:
             if signals:
                 if return_signals:
                     return signals
                     
                 if not silent_mode:
-                    print_table(signals, api_date)
-                    save_signals_to_file(signals, api_date)
+                    print_table(signals, api_date, query.timezone)
+                    record_fetched_signals(signals, query)
+                    export = input(Fore.YELLOW + "\nExport these signals to a text file? (y/n): " + Style.RESET_ALL).strip().lower()
+                    if export == 'y':
+                        export_signals_text(signals, api_date, query.timezone)
                 
                 return signals
             else:
@@ -801,6 +2724,167 @@ def fetch_signals(return_signals=False, silent_mode=False):
             print(Fore.RED + f"Error occurred while fetching signals: {str(e)}" + Style.RESET_ALL)
         return None
 
+def _next_trading_start(now, start_time):
+    """Return the next datetime at which the trading window opens"""
+    start_at = now.replace(hour=start_time.hour, minute=start_time.minute, second=0, microsecond=0)
+    if start_at <= now:
+        start_at += timedelta(days=1)
+    return start_at
+
+def _next_fetch_time(now, error_count):
+    """When an auto bot loop should fetch next after `error_count` consecutive failures
+
+    Failed fetches back off exponentially instead of pausing the loop, and
+    no fetch is attempted while the connection circuit is open.
+    """
+    delay = backoff_delay(error_count - 1) if error_count else AUTO_FETCH_INTERVAL
+    return now + timedelta(seconds=max(delay, CONNECTION_HEALTH.retry_in()))
+
+class SentLedger:
+    """Persistent, day-bucketed set of sent signal ids for one bot profile
+
+    Every signal belongs to the bucket of its execution day (undated ones
+    to today's): an in-memory set plus a DIR/YYYY-MM-DD.ids file of 8-byte
+    ids. An id is built from the minute, action and a CRC32 of the pair name
+    rather than Signal.key, whose pair codes are only meaningful inside one
+    process. Additions are appended to the day file and removals appended
+    as the complement (~id), so a restart replays them. Buckets older than
+    SENT_LEDGER_DAYS are dropped together with their files. Supports `in`,
+    add() and discard() for Signal objects, each O(1).
+    """
+
+    def __init__(self, directory, days=SENT_LEDGER_DAYS):
+        self.directory = directory
+        self.days = days
+        self._lock = threading.Lock()
+        self._buckets = {}     # day ordinal -> set of ids
+        self._pair_hashes = {}  # pair code -> CRC32 of the pair name
+        self._load()
+
+    def _entry(self, signal):
+        """(day ordinal, id) of a signal; the id is stable across processes"""
+        pair_hash = self._pair_hashes.get(signal.pair_code)
+        if pair_hash is None:
+            pair_hash = self._pair_hashes[signal.pair_code] = zlib.crc32(signal.pair.encode("utf-8"))
+        day = signal.date.toordinal() if signal.date is not None else datetime.now().toordinal()
+        return day, (signal.minute * len(SIGNAL_ACTIONS) + signal.action_code) << 32 | pair_hash
+
+    def _path(self, day):
+        return os.path.join(self.directory, datetime.fromordinal(day).strftime("%Y-%m-%d") + ".ids")
+
+    def _load(self):
+        try:
+            filenames = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for filename in filenames:
+            try:
+                day = datetime.strptime(filename, "%Y-%m-%d.ids").toordinal()
+                with open(os.path.join(self.directory, filename), "rb") as f:
+                    data = f.read()
+            except (ValueError, OSError):
+                continue
+            ids = array.array("q")
+            ids.frombytes(data[:len(data) - len(data) % ids.itemsize])  # Drop a torn final write
+            bucket = self._buckets.setdefault(day, set())
+            for signal_id in ids:
+                if signal_id >= 0:
+                    bucket.add(signal_id)
+                else:
+                    bucket.discard(~signal_id)
+        self._evict()
+
+    def _append(self, day, value):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._path(day), "ab") as f:
+                f.write(array.array("q", (value,)).tobytes())
+        except OSError as e:
+            report("sent_ledger_error", f"\nError saving sent signals: {str(e)}", "RED", logging.ERROR, error=e)
+
+    def _cutoff(self):
+        """First day ordinal inside the retention window"""
+        return datetime.now().toordinal() - self.days + 1
+
+    def _evict(self):
+        """Drop buckets (and files) of days before the retention window"""
+        cutoff = self._cutoff()
+        for day in [day for day in self._buckets if day < cutoff]:
+            del self._buckets[day]
+            try:
+                os.remove(self._path(day))
+            except OSError:
+                pass
+
+    def __contains__(self, signal):
+        day, signal_id = self._entry(signal)
+        bucket = self._buckets.get(day)
+        return bucket is not None and signal_id in bucket
+
+    def add(self, signal):
+        day, signal_id = self._entry(signal)
+        with self._lock:
+            bucket = self._buckets.get(day)
+            if bucket is None:
+                if day < self._cutoff():
+                    return  # Already expired
+                self._evict()
+                bucket = self._buckets[day] = set()
+            if signal_id not in bucket:
+                bucket.add(signal_id)
+                self._append(day, signal_id)
+
+    def discard(self, signal):
+        day, signal_id = self._entry(signal)
+        with self._lock:
+            bucket = self._buckets.get(day)
+            if bucket is not None and signal_id in bucket:
+                bucket.discard(signal_id)
+                self._append(day, ~signal_id)
+
+def open_sent_ledger(profile_name):
+    """Sent signal ledger of a bot profile, persisted under SENT_LEDGER_DIR"""
+    return SentLedger(os.path.join(SENT_LEDGER_DIR, profile_name))
+
+def _build_send_schedule(signals, now, send_before, sent_signals):
+    """Build a heap of (send_at, exec_at, signal_id, signal) for signals that still need sending"""
+    schedule = []
+    seen_ids = set()
+    for signal in signals:
+        hour, minute = divmod(signal.minute, 60)
+        exec_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+        signal_date = signal.date
+        if signal_date is not None:
+            # The parser resolved the execution date, so past signals are simply stale
+            exec_at = exec_at.replace(year=signal_date.year, month=signal_date.month, day=signal_date.day)
+            if exec_at < now:
+                continue
+        elif exec_at < now:
+            exec_at += timedelta(days=1)
+
+        signal_id = signal.key
+        if signal_id in seen_ids or signal in sent_signals:
+            continue
+        seen_ids.add(signal_id)
+
+        send_at = exec_at - timedelta(minutes=send_before)
+        schedule.append((send_at, exec_at, signal_id, signal))
+
+    heapq.heapify(schedule)
+    return schedule
+
+def _update_send_schedule(schedule, signals, now, send_before, sent_signals):
+    """Re-schedule only the signals that were added to or removed from the latest fetch"""
+    latest = {signal.key: signal for signal in signals}
+    scheduled_ids = {entry[2] for entry in schedule}
+
+    updated = [entry for entry in schedule if entry[2] in latest]
+    added = [signal for signal_id, signal in latest.items() if signal_id not in scheduled_ids]
+    updated.extend(_build_send_schedule(added, now, send_before, sent_signals))
+    heapq.heapify(updated)
+    return updated
+
 def auto_send_signals():
     """Automatically send signals to Telegram 1 minute before execution time"""
     if not DEFAULT_SETTINGS.get('telegram_bot_token') or not DEFAULT_SETTINGS.get('telegram_channel'):
@@ -808,9 +2892,12 @@ def auto_send_signals():
         hit_enter_to_continue()
         return
 
-    # Load auto bot settings
-    auto_settings = load_auto_bot_settings()
-    send_before = float(auto_settings.get('send_before', '1'))  # Minutes before to send signal
+    # Load auto bot settings and parse them once instead of on every pass
+    auto_settings = freeze_settings(load_auto_bot_settings())
+    config = get_auto_bot_config(auto_settings)
+    send_before = config.send_before  # Minutes before to send signal
+    query = config.query
+    start_time, end_time = config.trading_start, config.trading_end
     
     def display_settings():
         """Display current settings"""
@@ -827,38 +2914,65 @@ def auto_send_signals():
         
         print(Fore.CYAN + "\nBot Settings:" + Style.RESET_ALL)
         print(f"• Send Signal: {Fore.YELLOW}{send_before} minute(s) before execution{Style.RESET_ALL}")
-        print(f"• Timezone: {Fore.YELLOW}{TIMEZONE_OPTIONS[auto_settings['timezone']]['name']} ({TIMEZONE_OPTIONS[auto_settings['timezone']]['display']}){Style.RESET_ALL}")
+        timezone_info = get_timezone_info(auto_settings['timezone'])
+        print(f"• Timezone: {Fore.YELLOW}{timezone_info['name']} ({timezone_info['display']}){Style.RESET_ALL}")
+
+        http_stats = get_http_stats()
+        if http_stats['requests']:
+            print(Fore.CYAN + "\nConnection Stats:" + Style.RESET_ALL)
+            print(f"• Requests: {Fore.YELLOW}{http_stats['requests']} ({http_stats['errors']} failed){Style.RESET_ALL}")
+            print(f"• Reused Connections: {Fore.YELLOW}~{http_stats['pool_hits']} hit / ~{http_stats['pool_misses']} miss{Style.RESET_ALL}")
+            print(f"• Avg Latency: {Fore.YELLOW}{http_stats['avg_latency'] * 1000:.0f} ms{Style.RESET_ALL}")
+            print(f"• Connection: {Fore.YELLOW}{CONNECTION_HEALTH.status()}{Style.RESET_ALL}")
+            replay_age = get_replay_age()
+            if replay_age is not None:
+                print(f"• Signal Data: {Fore.YELLOW}replayed from cache, fetched {int(replay_age // 60)} min ago{Style.RESET_ALL}")
+
+        send_stats = get_send_queue().get_stats()
+        if send_stats['sent'] or send_stats['failed']:
+            print(f"• Telegram Sent: {Fore.YELLOW}{send_stats['sent']} ({send_stats['failed']} failed, {send_stats['rate_limited']} rate limited, {send_stats['stale']} stale){Style.RESET_ALL}")
+            print(f"• Delivery Latency: {Fore.YELLOW}p50 {send_stats['latency_p50']:.2f}s / p99 {send_stats['latency_p99']:.2f}s{Style.RESET_ALL}")
         
         print(Fore.YELLOW + "\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" + Style.RESET_ALL)
         print(Fore.GREEN + "✅ Bot is running and checking for signals..." + Style.RESET_ALL)
         print(Fore.RED + "🔴 Stop Bot Press Ctrl + C" + Style.RESET_ALL)
     
-    def refresh_display(force=False):
+    def refresh_display():
         """Helper function to refresh the display"""
-        nonlocal last_refresh_time
+        nonlocal next_refresh_time
         current_time = datetime.now()
-        
-        # Only refresh if forced or enough time has passed (2 minutes)
-        if force or (current_time - last_refresh_time).total_seconds() >= 120:
-            clear_screen_except_banner()
-            display_banner()
-            display_settings()
-            if next_signal:
-                print(Fore.CYAN + "\nNext Signal:" + Style.RESET_ALL)
-                print(Fore.YELLOW + f"• Pair: {next_signal[0].get('pair', '')}")
-                print(f"• Time: {next_signal[0].get('time', '')}")
-                print(f"• Action: {next_signal[0].get('action', '')}")
-                print(f"• Minutes until execution: {int(next_signal[2])}" + Style.RESET_ALL)
-            last_refresh_time = current_time
+        clear_screen_except_banner()
+        display_banner()
+        display_settings()
+        if schedule:
+            send_at, exec_at, signal_id, signal = schedule[0]
+            print(Fore.CYAN + "\nNext Signal:" + Style.RESET_ALL)
+            print(Fore.YELLOW + f"• Pair: {signal.pair}")
+            print(f"• Time: {signal.time}")
+            print(f"• Action: {signal.action}")
+            print(f"• Minutes until execution: {int((exec_at - current_time).total_seconds() / 60)}" + Style.RESET_ALL)
+        next_refresh_time = current_time + timedelta(seconds=DISPLAY_REFRESH_INTERVAL)
+    
+    def on_sent(signal, ok):
+        """Called by the send queue once a signal was delivered or given up on"""
+        if ok:
+            print(Fore.GREEN + f"\n✅ Signal sent for {signal.pair} | Execute at: {signal.time}" + Style.RESET_ALL)
+            record_sent_signal(signal, query, "auto_bot")
+        else:
+            sent_signals.discard(signal)  # Allow a retry on the next fetch
     
     clear_screen_except_banner()
     display_banner()
     display_settings()
     
-    last_check_time = None
-    sent_signals = set()  # Keep track of sent signals to avoid duplicates
-    next_signal = None
-    last_refresh_time = datetime.now()
+    send_queue = get_send_queue()
+    sent_signals = open_sent_ledger("auto_bot")  # Sent signals survive restarts, so nothing is sent twice
+    schedule = []  # Heap of (send_at, exec_at, signal_id, signal) ordered by send moment
+    last_signals = None  # Last fetched list; the fetch layer returns the same object when unchanged
+    next_signal_id = None
+    next_fetch_time = datetime.now()
+    next_refresh_time = datetime.now() + timedelta(seconds=DISPLAY_REFRESH_INTERVAL)
+    schedule_date = datetime.now().date()
     error_count = 0
     
     try:
@@ -866,133 +2980,359 @@ def auto_send_signals():
             try:
                 current_time = datetime.now()
                 
-                # Check if current time is within allowed range
-                current_time_only = current_time.time()
-                start_time = datetime.strptime(auto_settings['start_time'], "%H:%M").time()
-                end_time = datetime.strptime(auto_settings['end_time'], "%H:%M").time()
-                
-                if not (start_time <= current_time_only <= end_time):
-                    time.sleep(60)  # Sleep for 1 minute if outside trading hours
+                # Sleep until the trading window opens if we are outside of it
+                if not (start_time <= current_time.time() <= end_time):
+                    wake_time = _next_trading_start(current_time, start_time)
+                    time.sleep(max((wake_time - current_time).total_seconds(), 0))
+                    next_fetch_time = datetime.now()
                     continue
+
+                # Undated signals repeat daily, so reschedule everything once the date changes
+                if current_time.date() != schedule_date:
+                    schedule_date = current_time.date()
+                    last_signals = None
                 
-                # Only fetch new signals every 30 seconds
-                if last_check_time and (current_time - last_check_time).seconds < 30:
-                    time.sleep(0.1)  # Small sleep to prevent high CPU usage
-                    continue
-                
-                signals = fetch_signals_with_settings(auto_settings)
-                
-                if signals:
-                    error_count = 0  # Reset error count on successful fetch
-                    # Find the next upcoming signal
-                    upcoming_signals = []
-                    for signal in signals:
-                        try:
-                            signal_time_str = signal.get('time', '')
-                            if not signal_time_str:
-                                continue
-                                
-                            signal_time = datetime.strptime(signal_time_str, "%H:%M").replace(
-                                year=current_time.year,
-                                month=current_time.month,
-                                day=current_time.day
-                            )
-                            
-                            if signal_time < current_time:
-                                signal_time = signal_time + timedelta(days=1)
-                            
-                            signal_id = f"{signal_time_str}_{signal.get('pair', '')}_{signal.get('action', '')}"
-                            time_diff = (signal_time - current_time).total_seconds() / 60
-                            
-                            if signal_id not in sent_signals:
-                                upcoming_signals.append((signal, signal_time, time_diff, signal_id))
-                        except ValueError:
-                            continue
-                    
-                    # Sort upcoming signals by time
-                    upcoming_signals.sort(key=lambda x: x[1])
-                    
-                    # Update next signal info
-                    if upcoming_signals:
-                        new_next_signal = upcoming_signals[0]
-                        if new_next_signal != next_signal:
-                            next_signal = new_next_signal
-                            refresh_display(force=True)  # Force refresh when signal changes
-                    
-                    # Send signal if it's time
-                    if next_signal and next_signal[2] <= send_before and next_signal[2] >= send_before - 0.5:
-                        if send_to_telegram(None, next_signal[0], send_before):
-                            sent_signals.add(next_signal[3])
-                            print(Fore.GREEN + f"\n✅ Signal sent for {next_signal[0].get('pair', '')} | Execute at: {next_signal[0].get('time', '')}" + Style.RESET_ALL)
-                            next_signal = None  # Reset next signal after sending
-                            refresh_display(force=True)  # Force refresh after sending
+                # Refetch signals and rebuild the schedule every AUTO_FETCH_INTERVAL seconds.
+                # While offline, wait for the circuit to reopen instead of polling.
+                if current_time >= next_fetch_time and not is_connected():
+                    next_fetch_time = _next_fetch_time(current_time, error_count)
+                elif current_time >= next_fetch_time:
+                    try:
+                        signals = fetch_profile_signals(auto_settings)
+                        error_count = 0  # Reset error count on successful fetch
+                    except Exception as e:
+                        # Back off the next fetch only; scheduled signals keep going out
+                        signals = None
+                        error_count += 1
+                        METRICS.inc("growbot_loop_errors_total", profile="auto_bot")
+                        print(Fore.RED + f"\nError occurred while fetching signals: {str(e)}" + Style.RESET_ALL)
+                    next_fetch_time = _next_fetch_time(current_time, error_count)
+                    if signals and signals is not last_signals:
+                        schedule = _update_send_schedule(schedule, signals, current_time, send_before, sent_signals)
+                        last_signals = signals
+                        record_fetched_signals(signals, query)
                 
-                # Clean up old signals at midnight
-                if current_time.hour == 0 and current_time.minute == 0:
-                    sent_signals.clear()
+                # Queue every signal whose send moment has arrived
+                due = []
+                while schedule and schedule[0][0] <= current_time:
+                    send_at, exec_at, signal_id, signal = heapq.heappop(schedule)
                     
-                last_check_time = current_time
+                    # Skip signals whose send window was missed (e.g. the bot was busy or asleep)
+                    if (current_time - send_at).total_seconds() > SEND_WINDOW_SECONDS:
+                        continue
+
+                    # Mark as sent right away so a refetch cannot queue it twice
+                    sent_signals.add(signal)
+                    due.append(signal)
+
+                if due:
+                    send_queue.submit_signals(due, send_before, on_done=on_sent, timezone_choice=config.timezone)
                 
-                # Regular refresh check
-                refresh_display()
+                # Force a refresh when the next signal changes
+                upcoming_id = schedule[0][2] if schedule else None
+                if upcoming_id != next_signal_id:
+                    next_signal_id = upcoming_id
+                    next_refresh_time = current_time
                 
-                time.sleep(0.1)  # Small sleep to prevent high CPU usage
+                if current_time >= next_refresh_time:
+                    refresh_display()
                 
             except Exception as e:
                 error_count += 1
+                METRICS.inc("growbot_loop_errors_total", profile="auto_bot")
                 print(Fore.RED + f"\nError occurred: {str(e)}" + Style.RESET_ALL)
-                if error_count >= 3:  # If too many errors, wait longer
-                    time.sleep(60)  # Wait 1 minute before retrying
-                else:
-                    time.sleep(5)  # Short wait for minor errors
+                next_fetch_time = _next_fetch_time(datetime.now(), error_count)  # Back off longer after repeated errors
+                next_refresh_time = max(next_refresh_time, datetime.now() + timedelta(seconds=DISPLAY_REFRESH_INTERVAL))
+
+            # Sleep exactly until the next send, refetch or display refresh is due
+            wake_time = min(next_fetch_time, next_refresh_time)
+            if schedule:
+                wake_time = min(wake_time, schedule[0][0])
+            time.sleep(max((wake_time - datetime.now()).total_seconds(), 0))
                 
     except KeyboardInterrupt:
         print(Fore.YELLOW + "\nStopping Auto Signal Sender..." + Style.RESET_ALL)
         time.sleep(1)
         return
 
+async def _run_profile_async(name, profile, limiter):
+    """Fetch and dispatch signals for one bot profile inside the shared event loop"""
+    profile = freeze_settings(profile)  # Keys the parsed config and compiled caption caches
+    config = get_auto_bot_config(profile)
+    send_before = config.send_before
+    query = config.query
+    start_time, end_time = config.trading_start, config.trading_end
+
+    sent_signals = open_sent_ledger(name)
+    schedule = []
+    last_signals = None
+    next_fetch_time = datetime.now()
+    schedule_date = datetime.now().date()
+    error_count = 0
+
+    send_queue = get_send_queue()
+
+    def on_sent(signal, ok):
+        """Called by the send queue once a signal was delivered or given up on"""
+        if ok:
+            report("signal_sent", f"[{name}] ✅ Signal sent for {signal.pair} | Execute at: {signal.time}", profile=name, pair=signal.pair, time=signal.time)
+            record_sent_signal(signal, query, name)
+        else:
+            sent_signals.discard(signal)
+
+    while True:
+        try:
+            current_time = datetime.now()
+
+            if not (start_time <= current_time.time() <= end_time):
+                wake_time = _next_trading_start(current_time, start_time)
+                await asyncio.sleep(max((wake_time - current_time).total_seconds(), 0))
+                next_fetch_time = datetime.now()
+                continue
+
+            if current_time.date() != schedule_date:
+                schedule_date = current_time.date()
+                last_signals = None
+
+            if current_time >= next_fetch_time and not is_connected():
+                # Offline: keep sending what is scheduled and retry once the circuit reopens
+                next_fetch_time = _next_fetch_time(current_time, error_count)
+            elif current_time >= next_fetch_time:
+                try:
+                    async with limiter:
+                        signals = await asyncio.to_thread(fetch_profile_signals, profile)
+                    error_count = 0
+                except Exception as e:
+                    # Only the next fetch backs off; what is already scheduled keeps going out
+                    signals = None
+                    error_count += 1
+                    METRICS.inc("growbot_loop_errors_total", profile=name)
+                    report("profile_error", f"[{name}] Error occurred: {str(e)}", "RED", logging.ERROR, profile=name, error=e, errors=error_count)
+                next_fetch_time = _next_fetch_time(current_time, error_count)
+                if signals and signals is not last_signals:
+                    schedule = _update_send_schedule(schedule, signals, current_time, send_before, sent_signals)
+                    last_signals = signals
+                    report("signals_fetched", profile=name, signals=len(signals), scheduled=len(schedule))
+                    await asyncio.to_thread(record_fetched_signals, signals, query)
+
+            # Hand all due signals to the send queue together so same-minute pairs do not serialize
+            due = []
+            while schedule and schedule[0][0] <= current_time:
+                send_at, exec_at, signal_id, signal = heapq.heappop(schedule)
+                if (current_time - send_at).total_seconds() <= SEND_WINDOW_SECONDS:
+                    sent_signals.add(signal)
+                    due.append(signal)
+            if due:
+                send_queue.submit_signals(due, send_before, profile, on_sent, timezone_choice=config.timezone)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error_count += 1
+            METRICS.inc("growbot_loop_errors_total", profile=name)
+            report("profile_error", f"[{name}] Error occurred: {str(e)}", "RED", logging.ERROR, profile=name, error=e, errors=error_count)
+            next_fetch_time = _next_fetch_time(datetime.now(), error_count)
+
+        # Sleep until the next send or fetch; after an error the fetch is backed off, sends are not
+        wake_time = next_fetch_time
+        if schedule:
+            wake_time = min(wake_time, schedule[0][0])
+        await asyncio.sleep(max((wake_time - datetime.now()).total_seconds(), 0))
+
+async def run_profiles_async(profiles, max_concurrency=MAX_CONCURRENT_REQUESTS):
+    """Run every bot profile concurrently in one event loop"""
+    limiter = asyncio.Semaphore(max_concurrency)
+    await asyncio.gather(*(_run_profile_async(name, profile, limiter) for name, profile in profiles.items()))
+
+def auto_send_profiles():
+    """Run all bot profiles from BOT_PROFILES_DIR in a single process"""
+    profiles = load_bot_profiles()
+    if not profiles:
+        print(Fore.RED + f"\nNo bot profiles found. Add one JSON file per channel to: {BOT_PROFILES_DIR}" + Style.RESET_ALL)
+        print(Fore.YELLOW + "Each file uses the same fields as auto_bot_settings.json." + Style.RESET_ALL)
+        hit_enter_to_continue()
+        return
+
+    clear_screen_except_banner()
+    display_banner()
+    print(Fore.CYAN + f"\n📡 Running {len(profiles)} bot profile(s):" + Style.RESET_ALL)
+    for name, profile in profiles.items():
+        print(f"• {Fore.YELLOW}{name}{Style.RESET_ALL}: {profile['pairs']} → {profile['channel_id']} ({profile['send_before']} min before)")
+    print(Fore.RED + "\n🔴 Stop Bot Press Ctrl + C" + Style.RESET_ALL)
+
+    try:
+        asyncio.run(run_profiles_async(profiles))
+    except KeyboardInterrupt:
+        print(Fore.YELLOW + "\nStopping Multi-Channel Bot..." + Style.RESET_ALL)
+        time.sleep(1)
+
+BUILTIN_DEFAULT_SETTINGS = {
+    "pairs": "NZDCAD_otc",  # Default pair
+    "start_time": "00:00",  # Default start time
+    "end_time": "23:49",    # Default end time
+    "days": "3",            # Default number of days
+    "mode": "normal",       # Default mode
+    "min_percentage": "100", # Default minimum percentage
+    "filter_value": "2",    # Default filter (2 = Future Trend)
+    "separate": "1",        # Default separate by trend
+    "timezone": "1",        # Default timezone (India)
+    "telegram_bot_token": "",  # Default bot token
+    "telegram_channel": ""  # Default channel ID
+}
+
+DEFAULT_AUTO_BOT_SETTINGS = {
+    "pairs": "NZDCAD_otc",  # Default pairs
+    "start_time": "00:00",  # Default start time
+    "end_time": "23:49",    # Default end time
+    "days": "3",            # Default number of days
+    "mode": "normal",       # Default mode
+    "min_percentage": "100", # Default minimum percentage
+    "filter": "2",          # Default filter (2 = Future Trend)
+    "separate_trend": "1",  # Default separate by trend
+    "timezone": "1",        # Default timezone (India)
+    "bot_token": "",  # Default bot token
+    "channel_id": "",  # Default channel ID
+    "send_before": "1",     # Default minutes before to send signal
+    "fetch_shard_size": str(FETCH_SHARD_SIZE),   # Pairs per API sub-request
+    "fetch_concurrency": str(FETCH_CONCURRENCY),  # Parallel sub-requests per fetch
+    "coalesce_signals": "0"  # 1 = send same-minute signals as one media group
+}
+
+def write_json_atomic(path, data):
+    """Write JSON to a temp file next to `path` and rename it into place"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_file = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_file, 'w') as f:
+            json.dump(data, f, indent=4)
+        os.replace(temp_file, path)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+class FrozenSettings(dict):
+    """Read-only settings dict that hashes by identity, so it can key caches
+
+    Settings snapshots and bot profiles are frozen once and replaced, never
+    edited, when they change; a cache entry keyed on one cannot go stale.
+    """
+
+    __slots__ = ()
+    __hash__ = object.__hash__
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("settings snapshots are read-only; copy them with dict() to edit")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return FrozenSettings, (dict(self),)  # Pickle (e.g. to supervisor workers) without __setitem__
+
+def freeze_settings(settings):
+    """Return settings as a FrozenSettings, copying only if it is not one already"""
+    return settings if isinstance(settings, FrozenSettings) else FrozenSettings(settings)
+
+class SettingsFile:
+    """In-memory copy of a JSON settings file
+
+    The file is read once and re-read only when its mtime changes (checked
+    at most every SETTINGS_CHECK_INTERVAL seconds). snapshot() returns a
+    FrozenSettings for hot paths, the same object until the settings are
+    reloaded or saved, so it can key caches; save() writes atomically and
+    updates the cached copy.
+    """
+
+    def __init__(self, path, defaults):
+        self.path = path
+        self.defaults = defaults
+        self._lock = threading.Lock()
+        self._data = None
+        self._view = None
+        self._mtime = None
+        self._checked_at = 0.0
+
+    def _reload_if_changed(self):
+        now = time.monotonic()
+        if self._data is not None and now - self._checked_at < SETTINGS_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._data is not None and mtime == self._mtime:
+            return
+
+        data = None
+        if mtime is not None:
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = None
+        self._data = data if isinstance(data, dict) else dict(self.defaults)
+        self._view = FrozenSettings(self._data)
+        self._mtime = mtime
+
+    def snapshot(self):
+        """Frozen copy of the current settings (do not keep across reloads)"""
+        with self._lock:
+            self._reload_if_changed()
+            return self._view
+
+    def load(self):
+        """Mutable copy of the current settings"""
+        return dict(self.snapshot())
+
+    def save(self, settings):
+        """Atomically write settings to disk and refresh the cached copy"""
+        with self._lock:
+            write_json_atomic(self.path, settings)
+            self._data = dict(settings)
+            self._view = FrozenSettings(self._data)
+            try:
+                self._mtime = os.stat(self.path).st_mtime_ns
+            except OSError:
+                self._mtime = None
+            self._checked_at = time.monotonic()
+
+DEFAULT_SETTINGS_STORE = SettingsFile(DEFAULT_SETTINGS_FILE, BUILTIN_DEFAULT_SETTINGS)
+AUTO_BOT_SETTINGS_STORE = SettingsFile(AUTO_BOT_SETTINGS_FILE, DEFAULT_AUTO_BOT_SETTINGS)
+
 def load_settings():
     """Load settings from file"""
-    try:
-        with open(DEFAULT_SETTINGS_FILE, 'r') as f:
-            return json.load(f)
-    except:
-        return {
-            "pairs": "NZDCAD_otc",  # Default pair
-            "start_time": "00:00",  # Default start time
-            "end_time": "23:49",    # Default end time
-            "days": "3",            # Default number of days
-            "mode": "normal",       # Default mode
-            "min_percentage": "100", # Default minimum percentage
-            "filter_value": "2",    # Default filter (2 = Future Trend)
-            "separate": "1",        # Default separate by trend
-            "timezone": "1",        # Default timezone (India)
-            "telegram_bot_token": "",  # Default bot token
-            "telegram_channel": ""  # Default channel ID
-        }
+    return DEFAULT_SETTINGS_STORE.load()
 
 def load_auto_bot_settings():
     """Load auto bot settings from file"""
-    if os.path.exists(AUTO_BOT_SETTINGS_FILE):
+    return AUTO_BOT_SETTINGS_STORE.load()
+
+def load_bot_profiles():
+    """Load every bot profile from BOT_PROFILES_DIR as a {name: settings} dict"""
+    profiles = {}
+    if not os.path.isdir(BOT_PROFILES_DIR):
+        return profiles
+
+    for filename in sorted(os.listdir(BOT_PROFILES_DIR)):
+        if not filename.endswith(".json"):
+            continue
+        name = filename[:-len(".json")]
         try:
-            with open(AUTO_BOT_SETTINGS_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
-    return {
-        "pairs": "NZDCAD_otc",  # Default pairs
-        "start_time": "00:00",  # Default start time
-        "end_time": "23:49",    # Default end time
-        "days": "3",            # Default number of days
-        "mode": "normal",       # Default mode
-        "min_percentage": "100", # Default minimum percentage
-        "filter": "2",          # Default filter (2 = Future Trend)
-        "separate_trend": "1",  # Default separate by trend
-        "timezone": "1",        # Default timezone (India)
-        "bot_token": "",  # Default bot token
-        "channel_id": "",  # Default channel ID
-        "send_before": "1"      # Default minutes before to send signal
-    }
+            with open(os.path.join(BOT_PROFILES_DIR, filename), 'r') as f:
+                profile = dict(DEFAULT_AUTO_BOT_SETTINGS)
+                profile.update(json.load(f))
+        except Exception as e:
+            report("profile_load_error", f"Error loading bot profile {filename}: {str(e)}", "RED", logging.ERROR, file=filename, error=e)
+            continue
+
+        if not profile.get("bot_token") or not profile.get("channel_id"):
+            report("profile_skipped", f"Skipping bot profile {name}: Telegram bot token or channel not set.", "RED", logging.WARNING, profile=name)
+            continue
+        profile = freeze_settings(profile)
+        get_caption_templates(profile, str(profile.get('timezone', '1')))  # Compile (and validate) the caption up front
+        profiles[name] = profile
+    return profiles
 
 def configure_auto_bot_settings():
     """Configure settings for auto bot"""
@@ -1047,13 +3387,26 @@ def configure_auto_bot_settings():
     send_before = input(f"Enter minutes before to send signal (current: {current_settings.get('send_before', '1')}): ").strip()
     if send_before and send_before.isdigit():
         current_settings['send_before'] = send_before
+
+    # Update fetch planner settings
+    shard_size = input(f"Enter pairs per API request (current: {current_settings.get('fetch_shard_size', str(FETCH_SHARD_SIZE))}): ").strip()
+    if shard_size.isdigit() and int(shard_size) > 0:
+        current_settings['fetch_shard_size'] = shard_size
+
+    concurrency = input(f"Enter parallel API requests (current: {current_settings.get('fetch_concurrency', str(FETCH_CONCURRENCY))}): ").strip()
+    if concurrency.isdigit() and int(concurrency) > 0:
+        current_settings['fetch_concurrency'] = concurrency
+
+    coalesce = input(f"Group same-minute signals into one post? (1 for yes) (current: {current_settings.get('coalesce_signals', '0')}): ").strip()
+    if coalesce in ['0', '1']:
+        current_settings['coalesce_signals'] = coalesce
     
     # Update timezone
     print("\nSelect Timezone:")
     for tz_id, tz_info in TIMEZONE_OPTIONS.items():
         print(f"{tz_id}. {tz_info['name']} ({tz_info['display']})")
-    timezone = input(f"Enter timezone number (current: {current_settings.get('timezone', '')}): ").strip()
-    if timezone in TIMEZONE_OPTIONS:
+    timezone = input(f"Enter timezone number or UTC offset like UTC+5:45 (current: {current_settings.get('timezone', '')}): ").strip()
+    if get_timezone_info(timezone, default=None):
         current_settings['timezone'] = timezone
     
     # Update Telegram Settings
@@ -1073,12 +3426,8 @@ def configure_auto_bot_settings():
 
 def save_auto_bot_settings(settings):
     """Save auto bot settings to a JSON file and update Default Settings with Telegram info."""
-    # Ensure the directory exists
-    os.makedirs(os.path.dirname(AUTO_BOT_SETTINGS_FILE), exist_ok=True)
-    
     # Save auto bot settings
-    with open(AUTO_BOT_SETTINGS_FILE, 'w') as f:
-        json.dump(settings, f, indent=4)
+    AUTO_BOT_SETTINGS_STORE.save(settings)
     
     # Update Default Settings with Telegram information
     if 'bot_token' in settings and 'channel_id' in settings:
@@ -1090,8 +3439,7 @@ def save_auto_bot_settings(settings):
         default_settings['telegram_channel'] = settings['channel_id']
         
         # Save updated default settings
-        with open(DEFAULT_SETTINGS_FILE, 'w') as f:
-            json.dump(default_settings, f, indent=4)
+        DEFAULT_SETTINGS_STORE.save(default_settings)
         
         print(Fore.GREEN + "\nTelegram settings have been updated in both." + Style.RESET_ALL)
 
@@ -1151,15 +3499,14 @@ def save_default_settings():
         print(f"{tz_id}. {tz_info['name']} ({tz_info['display']})")
     
     while True:
-        timezone = input(Fore.YELLOW + f"Enter timezone number (current: {current_settings.get('timezone', 'Not Set')}): " + Style.RESET_ALL).strip()
-        if timezone in TIMEZONE_OPTIONS:
+        timezone = input(Fore.YELLOW + f"Enter timezone number or UTC offset like UTC+5:45 (current: {current_settings.get('timezone', 'Not Set')}): " + Style.RESET_ALL).strip()
+        if get_timezone_info(timezone, default=None):
             current_settings["timezone"] = timezone
             break
         print(Fore.RED + "Invalid timezone selection. Please try again." + Style.RESET_ALL)
     
     # Save settings to file
-    with open(DEFAULT_SETTINGS_FILE, 'w') as f:
-        json.dump(current_settings, f, indent=4)
+    DEFAULT_SETTINGS_STORE.save(current_settings)
     
     DEFAULT_SETTINGS = current_settings
     print(Fore.GREEN + "\n✅ Settings saved successfully!" + Style.RESET_ALL)
@@ -1222,6 +3569,9 @@ Signal Message Settings:
             "bot_token": "",
             "channel_id": "",
             "send_before": "1",
+            "fetch_shard_size": str(FETCH_SHARD_SIZE),
+            "fetch_concurrency": str(FETCH_CONCURRENCY),
+            "coalesce_signals": "0",
             "alert_title": "UPCOMING SIGNAL ALERT",
             "call_image_url": "https://i.ibb.co/Q8L6mk5/Growth.png",
             "put_image_url": "https://i.ibb.co/1vsFM2N/Growth-1.png",
@@ -1238,11 +3588,8 @@ Signal Message Settings:
         DEFAULT_SETTINGS = default_settings.copy()
         
         # Save default settings
-        with open(DEFAULT_SETTINGS_FILE, 'w') as f:
-            json.dump(default_settings, f, indent=4)
-            
-        with open(AUTO_BOT_SETTINGS_FILE, 'w') as f:
-            json.dump(default_auto_settings, f, indent=4)
+        DEFAULT_SETTINGS_STORE.save(default_settings)
+        AUTO_BOT_SETTINGS_STORE.save(default_auto_settings)
             
         print(Fore.GREEN + "\n✅ All settings have been reset to default values!" + Style.RESET_ALL)
         
@@ -1343,8 +3690,27 @@ def customize_signal_message():
     elif 'signal_rules' not in current_settings:
         current_settings['signal_rules'] = ["If the previous candle is weak, the signal should be avoided", "Follow Trend"]
 
+    # Telegram rejects the whole message on invalid HTML, so check it before saving
+    timezone_choice = str(current_settings.get('timezone', '1'))  # The auto bot's signal timezone
+    error = caption_template_error(current_settings, timezone_choice)
+    if error:
+        print(Fore.RED + f"\n❌ Signal message is not valid Telegram HTML: {error}" + Style.RESET_ALL)
+        print(Fore.YELLOW + "Settings were not saved." + Style.RESET_ALL)
+        hit_enter_to_continue()
+        return
+
+    # Cached Telegram uploads of replaced images are no longer valid
+    old_settings = load_auto_bot_settings()
+    replaced_urls = [
+        old_settings[key] for key in ('call_image_url', 'put_image_url')
+        if old_settings.get(key) and old_settings.get(key) != current_settings.get(key)
+    ]
+    if replaced_urls:
+        forget_photo_ids(replaced_urls)
+
     # Save the updated settings
     save_auto_bot_settings(current_settings)
+    get_caption_templates(AUTO_BOT_SETTINGS_STORE.snapshot(), timezone_choice)  # Compile for the auto bot
     print(Fore.GREEN + "\n✅ Signal message customization saved successfully!" + Style.RESET_ALL)
     hit_enter_to_continue()
 
@@ -1352,10 +3718,6 @@ def main():
     """Main function with all features"""
     # Initialize important directories at startup
     try:
-        # Create signals directory if it doesn't exist
-        signals_dir = os.path.join(APP_PATH, "Signals")
-        os.makedirs(signals_dir, exist_ok=True)
-        
         # Ensure data directory exists and is writable
         os.makedirs(DATA_DIR, exist_ok=True)
     except Exception as e:
@@ -1404,9 +3766,10 @@ def main():
                             print(Fore.YELLOW + "5. Configure Auto Bot Settings")
                             print(Fore.YELLOW + "6. Customize Signal Message")
                             print(Fore.YELLOW + "7. Reset All Settings to Default")
-                            print(Fore.YELLOW + "8. Logout")
+                            print(Fore.YELLOW + "8. Run All Bot Profiles")
+                            print(Fore.YELLOW + "9. Logout")
                             
-                            sub_choice = input(Fore.YELLOW + "\nEnter your choice (1-8): " + Style.RESET_ALL).strip()
+                            sub_choice = input(Fore.YELLOW + "\nEnter your choice (1-9): " + Style.RESET_ALL).strip()
                             
                             if sub_choice == "1":
                                 fetch_signals()
@@ -1427,6 +3790,8 @@ def main():
                             elif sub_choice == "7":
                                 reset_to_default()
                             elif sub_choice == "8":
+                                auto_send_profiles()
+                            elif sub_choice == "9":
                                 print(Fore.RED + "Logging out..." + Style.RESET_ALL)
                                 time.sleep(2)
                                 break
@@ -1452,7 +3817,358 @@ def main():
             hit_enter_to_continue()
 
 
+def parse_args(argv=None):
+    """Command line options; without --daemon the interactive menu runs"""
+    parser = argparse.ArgumentParser(description="GrowUp signal bot")
+    parser.add_argument("--daemon", action="store_true",
+                        help="run the auto bot headless: no menu, banner, screen clearing or colors")
+    parser.add_argument("--config", metavar="FILE",
+                        help="JSON file overriding auto bot settings (plus bot_token/channel_id) for --daemon")
+    parser.add_argument("--profiles", action="store_true",
+                        help="with --daemon, run every profile from the bot_profiles directory")
+    parser.add_argument("--supervisor", action="store_true",
+                        help="run every bot profile headless across a pool of worker processes")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="with --supervisor, number of worker processes (default: CPU count)")
+    parser.add_argument("--dedup-ttl", type=float, metavar="SECONDS",
+                        help=f"share a fetched response with identical queries for SECONDS (default: {SINGLE_FLIGHT_TTL})")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="with --daemon, serve Prometheus metrics at http://127.0.0.1:PORT/metrics"
+                             " (supervisor worker N uses PORT+N)")
+    parser.add_argument("--metrics-file", metavar="FILE",
+                        help=f"with --daemon, dump metrics as JSON to FILE every {METRICS_DUMP_INTERVAL} seconds"
+                             " (supervisor worker N writes FILE.N)")
+    parser.add_argument("--compress-archive", action="store_true",
+                        help="write the signal archive as gzip-compressed day files (.jsonl.gz)")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="daemon log level (default: INFO)")
+
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    history = commands.add_parser("history", help="query the signal history store and exit")
+    history.add_argument("--from", dest="start", metavar="YYYY-MM-DD",
+                         help="first execution date (default: 6 days before --to)")
+    history.add_argument("--to", dest="end", metavar="YYYY-MM-DD", help="last execution date (default: today)")
+    history.add_argument("--pair", help="only this pair, e.g. EURUSD_otc")
+    history.add_argument("--action", type=str.upper, choices=["CALL", "PUT", "N/A"], help="only this action")
+    history.add_argument("--sent", action="store_true", help="only signals that were sent to Telegram")
+    history.add_argument("--list", action="store_true", help="print every signal instead of counts per pair and action")
+
+    backtest = commands.add_parser("backtest", help="score stored signals against 1-minute candle files and exit")
+    backtest.add_argument("candles", nargs="+", metavar="CANDLES",
+                          help="CSV or Parquet candle file(s) with time (UTC), open, close and optionally pair columns")
+    backtest.add_argument("--from", dest="start", metavar="YYYY-MM-DD",
+                          help="first execution date (default: 6 days before --to)")
+    backtest.add_argument("--to", dest="end", metavar="YYYY-MM-DD", help="last execution date (default: today)")
+    backtest.add_argument("--pair", help="only this pair, e.g. EURUSD_otc")
+    backtest.add_argument("--sent", action="store_true", help="only signals that were sent to Telegram")
+    backtest.add_argument("--source", choices=["history", "archive"], default="history",
+                          help="where stored signals come from (default: history)")
+    backtest.add_argument("--martingale", type=int, metavar="STEPS",
+                          help="martingale steps after a loss (default: the auto bot's martingale_steps)")
+    return parser.parse_args(argv)
+
+def _command_dates(args):
+    """(start_date, end_date) of a history/backtest command; raises ValueError"""
+    end_date = datetime.strptime(args.end, "%Y-%m-%d").date() if args.end else datetime.now().date()
+    start_date = datetime.strptime(args.start, "%Y-%m-%d").date() if args.start else end_date - timedelta(days=6)
+    return start_date, end_date
+
+def run_history(args):
+    """Print signal history counts (or rows with --list) and return the exit code"""
+    try:
+        start_date, end_date = _command_dates(args)
+    except ValueError as e:
+        print(f"Invalid date: {e}", file=sys.stderr)
+        return 2
+
+    if args.list:
+        rows = query_signal_history(start_date, end_date, args.pair, args.action, args.sent)
+        for row in rows:
+            sent = datetime.fromtimestamp(row["sent_at"]).strftime("%Y-%m-%d %H:%M:%S") if row["sent_at"] else "-"
+            print(f"{row['date']} {row['time']} {row['pair']:<15} {row['action']:<4} tz={row['timezone']}"
+                  f" mode={row['mode']} filter={row['filter']} sent={sent}")
+        print(f"{len(rows)} signal(s) from {start_date} to {end_date}")
+        return 0
+
+    counts = count_signal_history(start_date, end_date, args.pair, args.action, args.sent)
+    for (pair, action), count in counts.items():
+        print(f"{pair:<15} {action:<4} {count:>8}")
+    print(f"{sum(counts.values())} signal(s) from {start_date} to {end_date}")
+    return 0
+
+def run_backtest(args):
+    """Backtest stored signals against candle files, print per-pair hit rates and return the exit code"""
+    try:
+        start_date, end_date = _command_dates(args)
+    except ValueError as e:
+        print(f"Invalid date: {e}", file=sys.stderr)
+        return 2
+    try:
+        _require_numpy()
+    except ImportError as e:
+        print(e, file=sys.stderr)
+        return 1
+    steps = args.martingale if args.martingale is not None else martingale_step_count(load_auto_bot_settings())
+
+    if args.source == "archive":
+        if args.sent:
+            print("--sent needs --source history", file=sys.stderr)
+            return 2
+        signals = query_signal_archive(start_date, end_date, [args.pair] if args.pair else None)
+    else:
+        signals = query_signal_history(start_date, end_date, args.pair, sent_only=args.sent)
+
+    try:
+        started = time.perf_counter()
+        candles = load_candles(args.candles)
+        loaded = time.perf_counter()
+        result = backtest_signals(signals, candles, martingale_steps=steps)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Backtest failed: {e}", file=sys.stderr)
+        return 1
+    finished = time.perf_counter()
+
+    step_labels = ["direct"] + [f"mtg{step}" for step in range(1, steps + 1)]
+    print(f"{'pair':<15} {'signals':>8} " + " ".join(f"{label:>7}" for label in step_labels)
+          + f" {'loss':>7} {'unknown':>7} {'win rate':>8}")
+    rows = list(result["pairs"].items()) + [("TOTAL", result["total"])]
+    for pair, stats in rows:
+        win_rate = f"{stats['win_rate'] * 100:7.1f}%" if stats["win_rate"] is not None else f"{'-':>8}"
+        print(f"{pair:<15} {stats['signals']:>8} " + " ".join(f"{wins:>7}" for wins in stats["wins"])
+              + f" {stats['losses']:>7} {stats['unknown']:>7} {win_rate}")
+    print(f"{len(signals)} signal(s) from {start_date} to {end_date} against {len(candles['keys'])} candles"
+          f" (load {loaded - started:.2f}s, score {finished - loaded:.2f}s)")
+    return 0
+
+def load_daemon_profiles(config_path=None, use_profiles=False):
+    """Return the {name: profile} dict the daemon should run"""
+    if use_profiles:
+        return load_bot_profiles()
+
+    profile = load_auto_bot_settings()
+    profile["bot_token"] = DEFAULT_SETTINGS.get("telegram_bot_token", "")
+    profile["channel_id"] = DEFAULT_SETTINGS.get("telegram_channel", "")
+    if config_path:
+        with open(config_path, 'r') as f:
+            profile.update(json.load(f))
+
+    if not profile.get("bot_token") or not profile.get("channel_id"):
+        report("profile_skipped", level=logging.ERROR, profile="auto_bot", reason="telegram bot token or channel not set")
+        return {}
+    return {profile.get("name", "auto_bot"): freeze_settings(profile)}
+
+def run_daemon(args):
+    """Run the auto bot without any terminal interaction and return the exit code
+
+    Logs go to stderr, one "event=... key=value" line each, so the bot can run
+    under systemd (ExecStart=python3 growup-mobile.py --daemon) and stops
+    cleanly on SIGTERM.
+    """
+    global DAEMON_MODE, DEFAULT_SETTINGS, SINGLE_FLIGHT_TTL
+    import signal as os_signal
+
+    DAEMON_MODE = True
+    logging.basicConfig(level=args.log_level, format="%(asctime)s %(levelname)s %(message)s")
+    DEFAULT_SETTINGS = load_settings()
+    if args.dedup_ttl is not None:
+        SINGLE_FLIGHT_TTL = args.dedup_ttl
+
+    login_info = saved_login()
+    if login_info is None:
+        report("login_failed", level=logging.ERROR, reason="no valid saved credentials; log in once interactively with save enabled")
+        return 1
+
+    try:
+        profiles = load_daemon_profiles(args.config, args.profiles)
+    except (OSError, ValueError) as e:
+        report("config_error", level=logging.ERROR, file=args.config, error=e)
+        return 2
+    if not profiles:
+        report("no_profiles", level=logging.ERROR, profiles_dir=BOT_PROFILES_DIR)
+        return 2
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    os_signal.signal(os_signal.SIGTERM, stop)
+    if args.metrics_port:
+        try:
+            start_metrics_server(args.metrics_port)
+        except OSError as e:
+            report("metrics_error", level=logging.ERROR, port=args.metrics_port, error=e)
+            return 2
+        report("metrics_serving", url=f"http://127.0.0.1:{args.metrics_port}/metrics")
+    if args.metrics_file:
+        start_metrics_dump(args.metrics_file)
+    report("daemon_started", user=login_info[0], profiles=",".join(profiles))
+    try:
+        asyncio.run(run_profiles_async(profiles))
+    except KeyboardInterrupt:
+        pass
+    report("daemon_stopped")
+    return 0
+
+def _profile_worker(slot, names, args):
+    """Supervisor worker process: run the named bot profiles until terminated"""
+    global DAEMON_MODE, DEFAULT_SETTINGS, SHARED_FETCH_MAX_AGE, SINGLE_FLIGHT_TTL, SIGNAL_ARCHIVE_COMPRESS
+    import signal as os_signal
+
+    DAEMON_MODE = True
+    logging.basicConfig(level=args.log_level, format=f"%(asctime)s %(levelname)s worker={slot} %(message)s")
+    DEFAULT_SETTINGS = load_settings()
+    if args.dedup_ttl is not None:
+        SINGLE_FLIGHT_TTL = args.dedup_ttl
+    if args.compress_archive:
+        SIGNAL_ARCHIVE_COMPRESS = True
+    # Workers polling the same query reuse each other's responses through the signal cache
+    SHARED_FETCH_MAX_AGE = AUTO_FETCH_INTERVAL / 2
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    os_signal.signal(os_signal.SIGTERM, stop)
+    if args.metrics_port:
+        start_metrics_server(args.metrics_port + slot)
+    if args.metrics_file:
+        start_metrics_dump(f"{args.metrics_file}.{slot}")
+
+    profiles = {name: profile for name, profile in load_bot_profiles().items() if name in names}
+    report("worker_started", profiles=",".join(profiles))
+    try:
+        asyncio.run(run_profiles_async(profiles))
+    except KeyboardInterrupt:
+        pass
+
+def _profile_files_state():
+    """{profile name: mtime} of the JSON files in BOT_PROFILES_DIR"""
+    state = {}
+    try:
+        for entry in os.scandir(BOT_PROFILES_DIR):
+            if entry.name.endswith(".json") and entry.is_file():
+                state[entry.name[:-len(".json")]] = entry.stat().st_mtime
+    except OSError:
+        pass
+    return state
+
+def run_supervisor(args):
+    """Spread the bot profiles over a pool of worker processes and keep them running
+
+    Profiles are assigned round-robin to min(--workers, profiles) workers.
+    Crashed workers (non-zero exit code) are restarted with exponential
+    backoff. A worker that exits cleanly had nothing left to run, so its slot
+    stays idle until its profiles change. BOT_PROFILES_DIR is rescanned every
+    PROFILE_RESCAN_INTERVAL seconds so added, edited or removed profiles only
+    restart the workers they affect.
+    """
+    global DAEMON_MODE, DEFAULT_SETTINGS
+    import signal as os_signal
+    import multiprocessing
+
+    DAEMON_MODE = True
+    logging.basicConfig(level=args.log_level, format="%(asctime)s %(levelname)s supervisor %(message)s")
+    DEFAULT_SETTINGS = load_settings()
+
+    login_info = saved_login()
+    if login_info is None:
+        report("login_failed", level=logging.ERROR, reason="no valid saved credentials; log in once interactively with save enabled")
+        return 1
+
+    context = multiprocessing.get_context("spawn")
+    max_workers = max(args.workers or os.cpu_count() or 1, 1)
+    workers = {}  # slot -> {"names", "process", "started", "crashes", "restart_at", "finished"}
+
+    def start_worker(slot, names, crashes=0):
+        process = context.Process(target=_profile_worker, args=(slot, names, args), name=f"growbot-worker-{slot}", daemon=True)
+        process.start()
+        workers[slot] = {"names": names, "process": process, "started": time.monotonic(), "crashes": crashes, "restart_at": None,
+                         "finished": False}
+        report("worker_spawned", slot=slot, pid=process.pid, profiles=",".join(names))
+
+    def stop_worker(slot):
+        process = workers.pop(slot)["process"]
+        if process.is_alive():
+            process.terminate()
+            process.join(10)
+            if process.is_alive():
+                process.kill()
+
+    def assign(files_state):
+        """Start, restart or stop workers so they match the current profile files"""
+        names = sorted(load_bot_profiles())
+        count = min(max_workers, len(names))
+        wanted = {slot: tuple(names[slot::count]) for slot in range(count)}
+        for slot in list(workers):
+            worker = workers[slot]
+            edited = any(files_state.get(name) != known_state.get(name) for name in worker["names"])
+            if wanted.get(slot) != worker["names"] or edited:
+                stop_worker(slot)
+        for slot, slot_names in wanted.items():
+            if slot not in workers:
+                start_worker(slot, slot_names)
+        if not names:
+            report("no_profiles", level=logging.WARNING, profiles_dir=BOT_PROFILES_DIR)
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    os_signal.signal(os_signal.SIGTERM, stop)
+    report("supervisor_started", user=login_info[0], max_workers=max_workers)
+
+    known_state = _profile_files_state()
+    assign(known_state)
+    next_rescan = time.monotonic() + PROFILE_RESCAN_INTERVAL
+    try:
+        while True:
+            time.sleep(1)
+            now = time.monotonic()
+
+            for slot, worker in list(workers.items()):
+                process = worker["process"]
+                if worker["finished"]:
+                    continue
+                if worker["restart_at"] is None and not process.is_alive() and process.exitcode == 0:
+                    # Clean exit: none of its profiles could run, so wait for the files to change
+                    worker["finished"] = True
+                    report("worker_finished", level=logging.WARNING, slot=slot, profiles=",".join(worker["names"]))
+                elif worker["restart_at"] is None and not process.is_alive():
+                    if now - worker["started"] >= WORKER_STABLE_SECONDS:
+                        worker["crashes"] = 0
+                    delay = backoff_delay(worker["crashes"])
+                    worker["restart_at"] = now + delay
+                    report("worker_exited", level=logging.WARNING, slot=slot, exitcode=process.exitcode, restart_in=delay)
+                elif worker["restart_at"] is not None and now >= worker["restart_at"]:
+                    start_worker(slot, worker["names"], worker["crashes"] + 1)
+
+            if now >= next_rescan:
+                next_rescan = now + PROFILE_RESCAN_INTERVAL
+                files_state = _profile_files_state()
+                if files_state != known_state:
+                    report("profiles_changed", profiles=",".join(sorted(files_state)))
+                    assign(files_state)
+                    known_state = files_state
+    except KeyboardInterrupt:
+        pass
+
+    for slot in list(workers):
+        stop_worker(slot)
+    report("supervisor_stopped")
+    return 0
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.compress_archive:
+        SIGNAL_ARCHIVE_COMPRESS = True
+    if args.command == "history":
+        sys.exit(run_history(args))
+    if args.command == "backtest":
+        sys.exit(run_backtest(args))
+    if args.supervisor:
+        sys.exit(run_supervisor(args))
+    if args.daemon:
+        sys.exit(run_daemon(args))
+
+    init_terminal()
+
     DEFAULT_SETTINGS = {
         "pairs": "BRLUSD_otc,USDPKR_otc",
         "start_time": "09:00",
@@ -0,0 +1,41 @@
+"""Shared fixtures: growup-mobile.py loaded as a module"""
+import os
+import sys
+import importlib.util
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_FILE = os.path.join(ROOT_DIR, "growup-mobile.py")
+
+def load_app():
+    """Import growup-mobile.py as a module (its file name is not importable directly)"""
+    spec = importlib.util.spec_from_file_location("growup_mobile", APP_FILE)
+    app = importlib.util.module_from_spec(spec)
+    sys.modules["growup_mobile"] = app
+    spec.loader.exec_module(app)
+
+    # DEFAULT_SETTINGS is normally created by the __main__ block
+    if not hasattr(app, "DEFAULT_SETTINGS"):
+        app.DEFAULT_SETTINGS = app.load_settings()
+    return app
+
+@pytest.fixture(scope="session")
+def app():
+    return load_app()
+
+@pytest.fixture
+def data_dir(app, tmp_path, monkeypatch):
+    """Point every file the app writes at tmp_path and start with empty stores and caches"""
+    monkeypatch.setattr(app, "SIGNAL_CACHE_FILE", str(tmp_path / "signal_cache.sqlite3"))
+    monkeypatch.setattr(app, "SIGNAL_ARCHIVE_DIR", str(tmp_path / "signal_archive"))
+    monkeypatch.setattr(app, "SIGNAL_HISTORY_FILE", str(tmp_path / "signal_history.sqlite3"))
+    monkeypatch.setattr(app, "SENT_LEDGER_DIR", str(tmp_path / "sent_ledger"))
+    monkeypatch.setattr(app, "TELEGRAM_FILE_IDS_FILE", str(tmp_path / "telegram_file_ids.json"))
+    for name in ("_signal_cache_db", "_signal_archive", "_signal_history_db", "_file_ids"):
+        monkeypatch.setattr(app, name, None)
+    monkeypatch.setattr(app, "_response_cache", {})
+    monkeypatch.setattr(app, "_replaying", {})
+    monkeypatch.setattr(app, "_merged_results", {})
+    monkeypatch.setattr(app, "CONNECTION_HEALTH", app.ConnectionHealth())
+    return tmp_path
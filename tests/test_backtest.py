@@ -0,0 +1,73 @@
+"""Backtesting signals against a small candle fixture"""
+from datetime import date
+
+import pytest
+
+pytest.importorskip("numpy")
+
+DAY = date(2025, 1, 16)
+MINUTE = 12 * 60  # Local signal time in timezone "1"
+
+# pair: (open, close) of the signal minute and the next one
+CANDLES = {
+    "WIN_otc": [(1.0, 1.1), (1.1, 1.0)],
+    "MTG_otc": [(1.0, 0.9), (0.9, 1.0)],
+    "LOSS_otc": [(1.0, 0.9), (0.9, 0.8)],
+    "FLAT_otc": [(1.0, 1.0), (1.0, 1.2)],
+    "GAP_otc": [(1.0, 0.9)],               # No candle for the martingale step
+}
+
+@pytest.fixture
+def candle_file(app, tmp_path):
+    start = (DAY - date(1970, 1, 1)).days * 1440 + MINUTE - app._utc_offset("1")
+    rows = ["time,pair,open,close"]
+    for pair, candles in CANDLES.items():
+        for step, (open_, close) in enumerate(candles):
+            rows.append(f"{(start + step) * 60},{pair},{open_},{close}")
+    path = tmp_path / "candles.csv"
+    path.write_text("\n".join(rows) + "\n")
+    return str(path)
+
+def signal(app, pair, action):
+    return app.Signal(app.intern_pair(pair), MINUTE, action, DAY)
+
+def test_outcomes(app, candle_file):
+    signals = [
+        signal(app, "WIN_otc", app.ACTION_CALL),    # Wins at step 0
+        signal(app, "MTG_otc", app.ACTION_CALL),    # Loses step 0, wins step 1
+        signal(app, "LOSS_otc", app.ACTION_CALL),   # Loses both steps
+        signal(app, "FLAT_otc", app.ACTION_CALL),   # A flat candle moves on; wins at step 1
+        signal(app, "GAP_otc", app.ACTION_CALL),    # Step 1 candle is missing
+        signal(app, "NONE_otc", app.ACTION_CALL),   # No candles at all
+        signal(app, "WIN_otc", app.ACTION_NONE),    # Nothing to score
+    ]
+    result = app.backtest_signals(signals, app.load_candles(candle_file), "1", martingale_steps=1)
+
+    loss, unknown = app.OUTCOME_LOSS, app.OUTCOME_UNKNOWN
+    assert result["outcomes"].tolist() == [1, 2, loss, 2, unknown, unknown, unknown]
+    assert result["total"] == {"signals": 7, "wins": [1, 2], "losses": 1, "unknown": 3, "win_rate": 0.75}
+    assert result["pairs"]["WIN_otc"] == {"signals": 2, "wins": [1, 0], "losses": 0, "unknown": 1, "win_rate": 1.0}
+
+def test_martingale_step_wins(app, candle_file):
+    signals = [signal(app, "MTG_otc", app.ACTION_PUT), signal(app, "WIN_otc", app.ACTION_PUT)]
+    candles = app.load_candles(candle_file)
+
+    assert app.backtest_signals(signals, candles, "1", martingale_steps=0)["outcomes"].tolist() == [1, app.OUTCOME_LOSS]
+    assert app.backtest_signals(signals, candles, "1", martingale_steps=1)["outcomes"].tolist() == [1, 2]
+
+def test_records_use_their_own_timezone(app, candle_file):
+    # The same moment written in two timezones; records carry theirs, Signal objects use the argument
+    offset = app._utc_offset("1") - app._utc_offset("UTC+0")
+    utc_minute = MINUTE - offset
+    records = [
+        {"date": DAY.isoformat(), "time": f"{MINUTE // 60:02d}:{MINUTE % 60:02d}", "pair": "WIN_otc", "action": "CALL", "timezone": "1"},
+        {"date": DAY.isoformat(), "time": f"{utc_minute // 60:02d}:{utc_minute % 60:02d}", "pair": "WIN_otc", "action": "CALL", "timezone": "UTC+0"},
+    ]
+    result = app.backtest_signals(records, app.load_candles(candle_file), "1")
+    assert result["outcomes"].tolist() == [1, 1]
+
+def test_missing_columns(app, tmp_path):
+    path = tmp_path / "EURUSD_otc.csv"
+    path.write_text("time,close\n0,1.0\n")
+    with pytest.raises(ValueError, match="time, open and close"):
+        app.load_candles(str(path))
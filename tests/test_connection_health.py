@@ -0,0 +1,76 @@
+"""ConnectionHealth circuit breaker state transitions"""
+from types import SimpleNamespace
+
+import pytest
+
+@pytest.fixture
+def clock(app, monkeypatch):
+    """Fake time.monotonic(); advance it by assigning clock.now"""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(app, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+def trip(health, app):
+    for _ in range(app.HEALTH_FAILURE_THRESHOLD):
+        health.record_failure()
+
+def test_closed_until_threshold(app, clock):
+    health = app.ConnectionHealth()
+    assert health.status() == "unknown"
+
+    for _ in range(app.HEALTH_FAILURE_THRESHOLD - 1):
+        health.record_failure()
+        assert health.allow_request()
+    assert health.status() == "unknown"
+
+    health.record_failure()
+    assert not health.allow_request()
+    assert health.status() == "offline"
+    assert health.retry_in() == app.BACKOFF_BASE
+
+def test_half_open_lets_one_probe_through(app, clock):
+    health = app.ConnectionHealth()
+    trip(health, app)
+
+    clock.now += app.BACKOFF_BASE
+    assert health.allow_request()
+    assert health.probing
+    assert not health.allow_request()  # Everyone else waits for the probe
+    assert health.status() == "offline"
+
+def test_failed_probe_reopens_for_longer(app, clock):
+    health = app.ConnectionHealth()
+    trip(health, app)
+    clock.now += app.BACKOFF_BASE
+    assert health.allow_request()
+
+    health.record_failure()
+    assert not health.probing
+    assert health.retry_in() == app.backoff_delay(1)
+    clock.now += app.backoff_delay(1) - 1
+    assert not health.allow_request()
+    clock.now += 1
+    assert health.allow_request()
+
+def test_successful_probe_closes(app, clock):
+    health = app.ConnectionHealth()
+    trip(health, app)
+    clock.now += app.BACKOFF_BASE
+    assert health.allow_request()
+
+    health.record_success()
+    assert health.status() == "online"
+    assert health.retry_in() == 0
+    assert health.allow_request() and health.allow_request()
+
+    # A single failure after recovery does not reopen the circuit
+    health.record_failure()
+    assert health.allow_request()
+
+def test_online_status_expires(app, clock):
+    health = app.ConnectionHealth()
+    health.record_success()
+    assert health.status() == "online"
+
+    clock.now += app.HEALTH_TTL + 1
+    assert health.status() == "unknown"
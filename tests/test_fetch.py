@@ -0,0 +1,93 @@
+"""Sharded signal fetches: merging, shard failures and offline replay"""
+import pytest
+
+PAIRS = ["A_otc", "B_otc", "C_otc", "D_otc", "E_otc"]
+PARAMS = {
+    "pairs": ",".join(PAIRS), "start_time": "00:00", "end_time": "23:59", "days": "1",
+    "mode": "normal", "min_percentage": "80", "filter": "1", "separate": "1"
+}
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+class FakeAPI:
+    """Stands in for http_get; pairs listed in `down` fail with a connection error"""
+
+    def __init__(self, app):
+        self.app = app
+        self.down = set()
+        self.requests = []
+
+    def __call__(self, url, params=None, timeout=None, headers=None):
+        pairs = params["pairs"].split(",")
+        self.requests.append(pairs)
+        if self.down.intersection(pairs):
+            raise self.app.requests.ConnectionError("connection refused")
+        # Later pairs signal earlier, so a merge that is not sorted shows
+        rows = ["Signals:", "Date: 16/01/2025"]
+        for pair in pairs:
+            minute = 600 - 10 * PAIRS.index(pair)
+            rows.append(f"PA～{pair}～{minute // 60:02d}:{minute % 60:02d}～CALL")
+        return FakeResponse("\n".join(rows) + "\n")
+
+@pytest.fixture
+def api(app, data_dir, monkeypatch):
+    api = FakeAPI(app)
+    monkeypatch.setattr(app, "http_get", api)
+    monkeypatch.setattr(app, "SINGLE_FLIGHT_TTL", 0)  # Every call below reaches the API
+    return api
+
+def fetch(app):
+    return app.fetch_signal_list_sharded(PARAMS, "2", shard_size=2, concurrency=3)
+
+def test_shards_merge_sorted(app, api):
+    api_date, signals = fetch(app)
+
+    assert sorted(api.requests) == [["A_otc", "B_otc"], ["C_otc", "D_otc"], ["E_otc"]]
+    assert api_date == "16/01/2025"
+    assert [signal.pair for signal in signals] == PAIRS[::-1]
+    assert [signal.time for signal in signals] == ["09:20", "09:30", "09:40", "09:50", "10:00"]
+
+def test_unchanged_merge_is_the_same_object(app, api):
+    first = fetch(app)
+    assert fetch(app) is first
+    assert len(api.requests) == 6
+
+def test_failed_shard_is_replayed(app, api):
+    first = fetch(app)
+    api.down.add("C_otc")
+
+    assert fetch(app) is first
+    assert app.get_replay_age() is not None
+
+    api.down.clear()
+    fetch(app)
+    assert app.get_replay_age() is None
+
+def test_failed_shard_is_replayed_from_disk(app, api, monkeypatch):
+    keys = {signal.key for signal in fetch(app)[1]}
+    monkeypatch.setattr(app, "_response_cache", {})  # As after a restart
+    api.down.add("C_otc")
+
+    assert {signal.key for signal in fetch(app)[1]} == keys
+
+def test_failed_shard_without_replay_fails_the_fetch(app, api):
+    api.down.add("C_otc")
+    with pytest.raises(app.requests.ConnectionError):
+        fetch(app)
+
+def test_replay_expires(app, api, monkeypatch):
+    fetch(app)
+    api.down.add("C_otc")
+    monkeypatch.setattr(app, "SIGNAL_CACHE_TTL", -1)  # Everything stored is now too old
+
+    with pytest.raises(app.requests.ConnectionError):
+        fetch(app)
+    assert app.get_replay_age() is None
@@ -0,0 +1,46 @@
+"""Telegram HTML validation of signal captions"""
+import pytest
+
+@pytest.mark.parametrize("text", [
+    "plain text",
+    "<b>bold</b> <i>italic</i> <u>under</u> <s>strike</s>",
+    "<b>nested <i>tags</i></b>",
+    '<a href="https://t.me/channel">link</a>',
+    '<span class="tg-spoiler">hidden</span> <tg-spoiler>hidden</tg-spoiler>',
+    "1 &lt; 2 &amp;&amp; 3 &gt; 2 &quot;quoted&quot; &#39; &#x27;",
+    "<B>upper case</B>",
+])
+def test_valid_html(app, text):
+    assert app.telegram_html_error(text) is None
+
+@pytest.mark.parametrize("text, reason", [
+    ("<div>block</div>", "unsupported tag <div>"),
+    ("<b>bold", "unclosed <b>"),
+    ("<b><i>crossed</b></i>", "unexpected </b>"),
+    ("text</i>", "unexpected </i>"),
+    ("<a>link</a>", "<a> needs an href"),
+    ("<span>text</span>", '<span> needs class="tg-spoiler"'),
+    ("&nbsp;", "unsupported entity &nbsp;"),
+    ("1 < 2", "unescaped '<' at position 2"),
+    ("R&D", "unescaped '&' at position 1"),
+])
+def test_invalid_html(app, text, reason):
+    assert app.telegram_html_error(text).startswith(reason)
+
+def test_invalid_caption_settings_are_sent_escaped(app):
+    settings = app.freeze_settings({"alert_title": "SIGNAL <NOW>", "signal_rules": ["Stop loss & take profit"]})
+    assert app.caption_template_error(settings, "1") is not None
+
+    signal = app.Signal(app.intern_pair("EURUSD_otc"), 600, app.ACTION_CALL)
+    _, caption = app.build_signal_photo(signal, 1, settings, "1")
+    assert app.telegram_html_error(caption) is None
+    assert "<b>SIGNAL &lt;NOW&gt;</b>" in caption
+    assert "Stop loss &amp; take profit" in caption
+
+def test_valid_caption_settings_are_kept(app):
+    settings = app.freeze_settings({"alert_title": "<i>SIGNAL</i>"})
+    assert app.caption_template_error(settings, "1") is None
+
+    signal = app.Signal(app.intern_pair("EURUSD_otc"), 600, app.ACTION_PUT)
+    _, caption = app.build_signal_photo(signal, 1, settings, "1")
+    assert "<b><i>SIGNAL</i></b>" in caption
@@ -0,0 +1,117 @@
+"""Send schedule: heap order, diffing, the send window and fetch backoff"""
+import heapq
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+NOW = datetime(2025, 1, 16, 10, 0)
+TODAY = NOW.date()
+
+def drain(schedule):
+    return [heapq.heappop(schedule) for _ in range(len(schedule))]
+
+def test_schedule_pops_in_send_order(app):
+    pair = app.intern_pair("EURUSD_otc")
+    signals = [app.Signal(pair, minute, app.ACTION_CALL, TODAY) for minute in (700, 615, 660)]
+
+    entries = drain(app._build_send_schedule(signals, NOW, 2, set()))
+
+    assert [signal.minute for _, _, _, signal in entries] == [615, 660, 700]
+    for send_at, exec_at, signal_id, signal in entries:
+        assert exec_at == datetime(2025, 1, 16, *divmod(signal.minute, 60))
+        assert send_at == exec_at - timedelta(minutes=2)
+        assert signal_id == signal.key
+
+def test_schedule_drops_stale_duplicate_and_sent_signals(app):
+    pair = app.intern_pair("EURUSD_otc")
+    stale = app.Signal(pair, 540, app.ACTION_CALL, TODAY)
+    undated = app.Signal(pair, 540, app.ACTION_PUT)
+    upcoming = app.Signal(pair, 660, app.ACTION_CALL, TODAY)
+    duplicate = app.Signal(pair, 660, app.ACTION_CALL, TODAY)
+    sent = app.Signal(pair, 720, app.ACTION_PUT, TODAY)
+
+    entries = drain(app._build_send_schedule([stale, undated, upcoming, duplicate, sent], NOW, 1, {sent}))
+
+    assert [signal for _, _, _, signal in entries] == [upcoming, undated]
+    assert entries[1][1] == datetime(2025, 1, 17, 9, 0)  # Undated signals already past repeat tomorrow
+
+def test_update_keeps_unchanged_entries(app):
+    pair = app.intern_pair("EURUSD_otc")
+    kept, removed, added = (app.Signal(pair, minute, app.ACTION_CALL, TODAY) for minute in (620, 640, 660))
+    schedule = app._build_send_schedule([kept, removed], NOW, 1, set())
+    kept_entry = next(entry for entry in schedule if entry[3] is kept)
+
+    # The refetch parses new objects; the one with kept's key must not be rescheduled
+    refetched = app.Signal(pair, 620, app.ACTION_CALL, TODAY)
+    schedule = app._update_send_schedule(schedule, [refetched, added], NOW, 1, set())
+
+    entries = drain(schedule)
+    assert entries[0] is kept_entry
+    assert [signal for _, _, _, signal in entries] == [kept, added]
+
+def test_update_does_not_reschedule_sent_signals(app):
+    pair = app.intern_pair("EURUSD_otc")
+    signal = app.Signal(pair, 620, app.ACTION_CALL, TODAY)
+    schedule = app._build_send_schedule([signal], NOW, 1, set())
+    heapq.heappop(schedule)  # Sent
+
+    assert app._update_send_schedule(schedule, [signal], NOW, 1, {signal}) == []
+
+def test_next_fetch_backs_off_after_errors(app, data_dir):
+    assert app._next_fetch_time(NOW, 0) == NOW + timedelta(seconds=app.AUTO_FETCH_INTERVAL)
+    assert app._next_fetch_time(NOW, 1) == NOW + timedelta(seconds=app.BACKOFF_BASE)
+    assert app._next_fetch_time(NOW, 3) == NOW + timedelta(seconds=app.BACKOFF_BASE * 4)
+    assert app._next_fetch_time(NOW, 20) == NOW + timedelta(seconds=app.BACKOFF_MAX)
+
+class RecordingQueue:
+    def __init__(self):
+        self.sent = []
+
+    def submit_signals(self, signals, send_before, profile=None, on_done=None, timezone_choice=None):
+        self.sent.extend(signals)
+
+def run_profile(app, monkeypatch, fetch, send_before, seconds):
+    """Run the async auto bot loop of one profile for a while; return the signals it sent"""
+    queue = RecordingQueue()
+    monkeypatch.setattr(app, "fetch_profile_signals", fetch)
+    monkeypatch.setattr(app, "get_send_queue", lambda: queue)
+    monkeypatch.setattr(app, "AUTO_FETCH_INTERVAL", 0.2)
+    profile = dict(app.DEFAULT_AUTO_BOT_SETTINGS, send_before=repr(send_before), start_time="00:00", end_time="23:59")
+
+    async def main():
+        task = asyncio.create_task(app._run_profile_async("test", profile, asyncio.Semaphore(1)))
+        await asyncio.sleep(seconds)
+        task.cancel()
+
+    asyncio.run(main())
+    return queue.sent
+
+def upcoming_signal(app, now):
+    """A dated signal at least a minute ahead, and its execution time"""
+    exec_at = now.replace(second=0, microsecond=0) + timedelta(minutes=2)
+    return app.Signal(app.intern_pair("EURUSD_otc"), exec_at.hour * 60 + exec_at.minute, app.ACTION_CALL, exec_at.date()), exec_at
+
+@pytest.mark.parametrize("late, sent", [(10, True), (40, False)])
+def test_send_window(app, data_dir, monkeypatch, late, sent):
+    now = datetime.now()
+    signal, exec_at = upcoming_signal(app, now)
+    send_before = ((exec_at - now).total_seconds() + late) / 60  # Its send moment passed `late` seconds ago
+    signals = [signal]
+
+    assert run_profile(app, monkeypatch, lambda profile: signals, send_before, 0.5) == ([signal] if sent else [])
+
+def test_failed_fetch_does_not_delay_scheduled_sends(app, data_dir, monkeypatch):
+    now = datetime.now()
+    signal, exec_at = upcoming_signal(app, now)
+    send_before = ((exec_at - now).total_seconds() - 1) / 60  # Due in a second
+    fetches = []
+
+    def fetch(profile):
+        fetches.append(profile)
+        if len(fetches) > 1:
+            raise RuntimeError("API down")
+        return [signal]
+
+    assert run_profile(app, monkeypatch, fetch, send_before, 2) == [signal]
+    assert len(fetches) >= 2
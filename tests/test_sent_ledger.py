@@ -0,0 +1,50 @@
+"""SentLedger persistence"""
+import sys
+import subprocess
+from datetime import date
+
+from conftest import APP_FILE
+
+# Interns the pairs in the opposite order, so their process-local pair codes differ from the parent's
+CHILD = """
+import sys, importlib.util
+from datetime import date
+spec = importlib.util.spec_from_file_location("growup_mobile", sys.argv[1])
+app = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(app)
+day = date.fromisoformat(sys.argv[3])
+codes = [app.intern_pair(pair) for pair in ("LEDGER_B_otc", "LEDGER_A_otc")]
+ledger = app.SentLedger(sys.argv[2])
+for code in codes:
+    for minute, action in ((600, 0), (601, 1), (602, 0)):
+        print(app.PAIR_CODES[code], minute, action, app.Signal(code, minute, action, day) in ledger)
+"""
+
+def test_ledger_ids_survive_a_fresh_interpreter(app, tmp_path):
+    today = date.today()
+    pair_a = app.intern_pair("LEDGER_A_otc")
+    pair_b = app.intern_pair("LEDGER_B_otc")
+    ledger = app.SentLedger(str(tmp_path))
+    ledger.add(app.Signal(pair_a, 600, 0, today))
+    ledger.add(app.Signal(pair_b, 601, 1, today))
+    ledger.add(app.Signal(pair_b, 602, 0, today))
+    ledger.discard(app.Signal(pair_b, 602, 0, today))  # A failed send is forgotten again
+
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, APP_FILE, str(tmp_path), today.isoformat()],
+        capture_output=True, text=True, check=True
+    ).stdout.split("\n")
+    found = {tuple(line.split()[:3]) for line in output if line.endswith("True")}
+    assert found == {("LEDGER_A_otc", "600", "0"), ("LEDGER_B_otc", "601", "1")}
+
+def test_ledger_drops_days_outside_retention(app, tmp_path):
+    pair = app.intern_pair("LEDGER_A_otc")
+    old_day = date.fromordinal(date.today().toordinal() - 5)
+    ledger = app.SentLedger(str(tmp_path), days=3)
+    ledger.add(app.Signal(pair, 600, 0, old_day))
+    ledger.add(app.Signal(pair, 600, 0, date.today()))
+
+    reloaded = app.SentLedger(str(tmp_path), days=3)
+    assert app.Signal(pair, 600, 0, old_day) not in reloaded
+    assert app.Signal(pair, 600, 0, date.today()) in reloaded
+    assert [path.name for path in tmp_path.iterdir()] == [f"{date.today():%Y-%m-%d}.ids"]